@@ -3,42 +3,72 @@ Multi-Client Viewer - Baby Tank - Multi-Client Picture-in-Picture Viewer
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
-from PIL import Image, ImageGrab, ImageTk, ImageDraw
+from PIL import Image, ImageTk
 import win32gui
 import win32con
-import win32ui
 import win32process
-from ctypes import windll
+import ctypes
+from ctypes import windll, wintypes
 import time
 import threading
 import logging
 import sys
 from logging.handlers import RotatingFileHandler
-import requests
 import json
 import os
 import subprocess
 import tempfile
 import queue
-import psutil
-import webbrowser
 import io
 import re
+import functools
+import atexit
+import collections
+import dataclasses
+import zlib
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+__all__ = [
+    "PiPBoard",
+    "ModernButton",
+    "ModernToggle",
+    "WindowCapture",
+    "WindowEventWatcher",
+    "ClientState",
+    "AdaptiveSleeper",
+    "get_current_version",
+    "save_current_version",
+    "get_setting",
+    "save_setting",
+    "compare_versions",
+    "get_latest_release",
+    "check_for_updates",
+    "check_updates_on_startup",
+    "check_for_updates_in_background",
+    "get_process_cpu_usage",
+    "shrink_to_thumbnail",
+    "is_window_cloaked",
+]
 
 # Store version and logs in memory instead of files
 IN_MEMORY_VERSION = None
-IN_MEMORY_LOGS = []
 MAX_LOG_ENTRIES = 1000
+IN_MEMORY_LOGS = collections.deque(maxlen=MAX_LOG_ENTRIES)
+
+# Matches the version in filenames like MultiClientViewer-v1.0.35.exe
+VERSION_PATTERN = re.compile(r'v?(\d+\.\d+\.\d+)', re.ASCII)
 
+@functools.lru_cache(maxsize=1)
 def get_version_from_filename():
-    """Extract version from the executable filename"""
+    """Extract version from the executable filename (fixed for the process lifetime)"""
     try:
         if getattr(sys, 'frozen', False):
             exe_path = sys.executable
             filename = os.path.basename(exe_path)
             
             # Match patterns like: MultiClientViewer-v1.0.35.exe
-            match = re.search(r'v?(\d+\.\d+\.\d+)', filename)
+            match = VERSION_PATTERN.search(filename)
             if match:
                 version = 'v' + match.group(1)
                 # Use print instead of logging if logger isn't ready
@@ -51,11 +81,6 @@ def get_version_from_filename():
         print(f"Error reading version from filename: {e}")
         return None
 
-# Store version and logs in memory instead of files
-IN_MEMORY_VERSION = None
-IN_MEMORY_LOGS = []
-MAX_LOG_ENTRIES = 1000
-
 # Settings storage
 IN_MEMORY_SETTINGS = {
     "theme": "dark",
@@ -68,12 +93,32 @@ IN_MEMORY_SETTINGS = {
 
 class MemoryLogHandler(logging.Handler):
     """Custom log handler that stores logs in memory"""
+    # Bound once so the handler always appends to the buffer the UI reads
+    entries = IN_MEMORY_LOGS
+    # Total entries ever emitted; lets readers fetch only what they have not seen
+    emitted = 0
+    _buffer_lock = threading.Lock()  # Guards entries and emitted; Handler.lock is per instance
+    
     def emit(self, record):
-        global IN_MEMORY_LOGS
         log_entry = self.format(record)
-        IN_MEMORY_LOGS.append(log_entry)
-        if len(IN_MEMORY_LOGS) > MAX_LOG_ENTRIES:
-            IN_MEMORY_LOGS.pop(0)
+        with MemoryLogHandler._buffer_lock:
+            self.entries.append(log_entry)  # Bounded deque drops the oldest entry
+            MemoryLogHandler.emitted += 1
+    
+    @classmethod
+    def entries_since(cls, seen):
+        """Return (emitted, new_entries, full) for a reader that has seen `seen` entries.
+        
+        If some unseen entries were already dropped from the buffer, every
+        buffered entry is returned and full is True.
+        """
+        with cls._buffer_lock:
+            missing = cls.emitted - seen
+            if missing > len(cls.entries):
+                return cls.emitted, list(cls.entries), True
+            if missing == 0:
+                return cls.emitted, [], False
+            return cls.emitted, list(cls.entries)[-missing:], False
 
 GITHUB_REPO = "BabyTank-Projects/MultiClientViewer"
 
@@ -102,6 +147,7 @@ def save_setting(key, value):
     global IN_MEMORY_SETTINGS
     IN_MEMORY_SETTINGS[key] = value
 
+@functools.lru_cache(maxsize=32)
 def compare_versions(current, latest):
     """Compare version strings (e.g., '1.0.6' vs '1.0.7')"""
     try:
@@ -115,13 +161,51 @@ def compare_versions(current, latest):
     except:
         return True
 
+# Release info is reused for this long before GitHub is asked again
+RELEASE_CACHE_TTL = 600
+STARTUP_UPDATE_CHECK_DELAY_MS = 5000
+_release_cache = {"data": None, "ts": 0.0, "etag": None}
+
+# One session so repeat update checks reuse the TLS connection to GitHub
+_GH_SESSION = None
+
+def get_github_session():
+    """Create the shared GitHub session on first use"""
+    global _GH_SESSION
+    if _GH_SESSION is None:
+        import requests  # Deferred: only needed once an update check runs
+        from requests.adapters import HTTPAdapter
+        _GH_SESSION = requests.Session()
+        _GH_SESSION.headers.update({
+            "User-Agent": "MultiClientViewer",
+            "Accept": "application/vnd.github+json"
+        })
+        # Only api.github.com is ever spoken to; keep one small pool for it
+        _GH_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        atexit.register(_GH_SESSION.close)
+    return _GH_SESSION
+
 def get_latest_release():
-    """Fetch the latest release info from GitHub"""
+    """Fetch the latest release info from GitHub (cached for RELEASE_CACHE_TTL seconds)"""
+    if _release_cache["data"] is not None and time.monotonic() - _release_cache["ts"] < RELEASE_CACHE_TTL:
+        return _release_cache["data"]
+    
     try:
         url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        response = requests.get(url, timeout=5)
+        headers = {}
+        if _release_cache["data"] is not None and _release_cache["etag"]:
+            headers["If-None-Match"] = _release_cache["etag"]
+        
+        response = get_github_session().get(url, headers=headers, timeout=(3, 5))
+        if response.status_code == 304:
+            # Unchanged since the last check
+            _release_cache["ts"] = time.monotonic()
+            return _release_cache["data"]
         if response.status_code == 200:
-            return response.json()
+            _release_cache["data"] = response.json()
+            _release_cache["etag"] = response.headers.get("ETag")
+            _release_cache["ts"] = time.monotonic()
+            return _release_cache["data"]
         return None
     except Exception as e:
         print(f"Error checking for updates: {e}")
@@ -129,8 +213,10 @@ def get_latest_release():
 
 def check_for_updates(show_no_update_message=False):
     """Check for updates and show link to GitHub release"""
-    release_info = get_latest_release()
-    
+    report_update_check(get_latest_release(), show_no_update_message)
+
+def report_update_check(release_info, show_no_update_message=False):
+    """Tell the user what an update check found (must run on the UI thread)"""
     if not release_info:
         if show_no_update_message:
             messagebox.showinfo("Update Check", "Unable to check for updates. Please try again later.")
@@ -163,6 +249,7 @@ def check_for_updates(show_no_update_message=False):
 
     if result:
         # User wants to download
+        import webbrowser
         webbrowser.open(release_url)
     else:
         # User clicked No - ask if they already updated
@@ -174,15 +261,23 @@ def check_for_updates(show_no_update_message=False):
         if user_response:
             save_current_version(latest_version)
 
-def check_updates_on_startup():
-    """Check for updates in background thread on startup"""
+def check_for_updates_in_background(ui_call, show_no_update_message=False):
+    """Fetch release info on a background thread, then report it through ui_call.
+    
+    ui_call(func, *args) must run func on the UI thread, so the GitHub request
+    never blocks Tk and the message boxes are never shown from a worker.
+    """
     def bg_check():
-        # Don't auto-save version on startup - let user decide
-        check_for_updates(show_no_update_message=False)
+        ui_call(report_update_check, get_latest_release(), show_no_update_message)
     
     thread = threading.Thread(target=bg_check, daemon=True)
     thread.start()
 
+def check_updates_on_startup(ui_call):
+    """Check for updates in background thread on startup"""
+    # Don't auto-save version on startup - let user decide
+    check_for_updates_in_background(ui_call, show_no_update_message=False)
+
 def setup_logging():
     """Setup logging to memory instead of file"""
     logger = logging.getLogger()
@@ -204,15 +299,73 @@ def setup_logging():
 
 setup_logging()
 
-def get_process_cpu_usage(hwnd):
-    """Get CPU usage for a specific window"""
-    try:
-        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        process = psutil.Process(pid)
+class AdaptiveSleeper:
+    """Paces a worker loop and backs it off while there is nothing to do.
+    
+    While the loop keeps reporting work it sleeps the interval it asks for.
+    After 100ms without work it drops to 50ms ticks, and after a further
+    second it parks at 500ms ticks until mark_active() wakes it. wait()
+    returns True once the stop event is set.
+    """
+    BUSY_GRACE = 0.1
+    IDLE_INTERVAL = 0.05
+    IDLE_PERIOD = 1.0
+    PARKED_INTERVAL = 0.5
+    
+    def __init__(self, stop_event):
+        self._stop = stop_event
+        self._wake = threading.Event()
+        self.last_work_ts = time.monotonic()
+    
+    def record_work(self):
+        """Called by the loop itself when a tick had something to do"""
+        self.last_work_ts = time.monotonic()
+    
+    def mark_active(self):
+        """Called from outside the loop to bring it back to full speed (or to stop) immediately"""
+        self.last_work_ts = time.monotonic()
+        self._wake.set()
+    
+    def wait(self, busy_interval):
+        idle_for = time.monotonic() - self.last_work_ts
+        if idle_for < self.BUSY_GRACE:
+            timeout = busy_interval
+        elif idle_for < self.BUSY_GRACE + self.IDLE_PERIOD:
+            timeout = max(busy_interval, self.IDLE_INTERVAL)
+        else:
+            timeout = self.PARKED_INTERVAL
+        
+        self._wake.wait(timeout)
+        self._wake.clear()
+        return self._stop.is_set()
+
+def get_process_cpu_usage(process):
+    """Get CPU usage for a cached psutil.Process"""
+    with process.oneshot():
         cpu = process.cpu_percent(interval=None)
-        return cpu if cpu > 0 else 0.0
-    except:
-        return 0.0
+    return cpu if cpu > 0 else 0.0
+
+# Minimum number of queued UI updates handled per process_ui_queue tick
+UI_QUEUE_MIN_BATCH = 16
+
+# Background clients refresh every CAPTURE_MIN_INTERVAL seconds while busy and
+# back off by up to CAPTURE_IDLE_BACKOFF more as their CPU use drops toward 0
+CAPTURE_MIN_INTERVAL = 0.5
+CAPTURE_IDLE_BACKOFF = 2.0
+CAPTURE_BUSY_CPU = 20.0  # CPU % at which a client counts as fully busy
+# The capture loop sleeps until the next client is due, but re-checks at least
+# this often so foreground and pause changes are picked up without an event
+CAPTURE_MAX_SLEEP = 0.25
+# A window that captured successfully this recently is known to still exist
+CAPTURE_ALIVE_WINDOW = 2.0
+# The foreground client's interval doubles with each identical frame, up to this
+CAPTURE_STATIC_MAX_INTERVAL = 1.0
+
+# Removed client cards kept around for reuse instead of being rebuilt
+CARD_POOL_MAX = 8
+
+# One window enumeration for the Add Window list is reused for this many seconds
+WINDOW_LIST_TTL = 2.0
 
 # Thumbnail size presets (width, height)
 THUMBNAIL_SIZES = {
@@ -221,6 +374,371 @@ THUMBNAIL_SIZES = {
     "large": (480, 360)
 }
 
+def shrink_to_thumbnail(img, size, resample=Image.LANCZOS):
+    """Downscale a full-resolution capture to the thumbnail size.
+    
+    A power-of-two reduce() does the bulk of the shrink with a cheap box
+    filter, so the final resample pass only has to touch a small image.
+    """
+    width, height = img.size
+    thumb_width, thumb_height = size
+    
+    factor = 1
+    while width // (factor * 2) >= thumb_width and height // (factor * 2) >= thumb_height:
+        factor *= 2
+    
+    if factor > 1:
+        img = img.reduce(factor)
+    
+    return img.resize(size, resample)
+
+# GDI structures and prototypes for the persistent capture bitmap
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+PW_CLIENTONLY_FULLCONTENT = 3
+HALFTONE = 4
+SRCCOPY = 0x00CC0020
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", BITMAPINFOHEADER),
+        ("bmiColors", wintypes.DWORD * 3),
+    ]
+
+gdi32 = windll.gdi32
+gdi32.CreateCompatibleDC.restype = wintypes.HDC
+gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+gdi32.CreateDIBSection.argtypes = [
+    wintypes.HDC, ctypes.POINTER(BITMAPINFO), wintypes.UINT,
+    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD
+]
+gdi32.SelectObject.restype = wintypes.HGDIOBJ
+gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+gdi32.DeleteDC.argtypes = [wintypes.HDC]
+gdi32.SetStretchBltMode.argtypes = [wintypes.HDC, ctypes.c_int]
+gdi32.SetBrushOrgEx.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+gdi32.StretchBlt.argtypes = [
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.DWORD
+]
+windll.user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+
+DWMWA_CLOAKED = 14
+
+def is_window_cloaked(hwnd):
+    """True if DWM is hiding the window (other virtual desktop, suspended UWP app)"""
+    cloaked = wintypes.DWORD()
+    try:
+        result = windll.dwmapi.DwmGetWindowAttribute(
+            wintypes.HWND(hwnd), DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked))
+    except (AttributeError, OSError):
+        return False  # No DWM (Windows 7 with composition off)
+    return result == 0 and cloaked.value != 0
+
+class _DibSurface:
+    """A memory DC with a top-down 32bpp DIB section selected into it"""
+    __slots__ = ("dc", "bitmap", "old_bitmap", "pixels", "size")
+    
+    def __init__(self, width, height):
+        bmi = BITMAPINFO()
+        bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.bmiHeader.biWidth = width
+        bmi.bmiHeader.biHeight = -height  # Negative height = top-down rows
+        bmi.bmiHeader.biPlanes = 1
+        bmi.bmiHeader.biBitCount = 32
+        bmi.bmiHeader.biCompression = BI_RGB
+        
+        bits = ctypes.c_void_p()
+        dc = gdi32.CreateCompatibleDC(None)
+        bitmap = gdi32.CreateDIBSection(dc, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+        if not bitmap or not bits.value:
+            gdi32.DeleteDC(dc)
+            raise ctypes.WinError()
+        
+        self.dc = dc
+        self.bitmap = bitmap
+        self.old_bitmap = gdi32.SelectObject(dc, bitmap)
+        self.pixels = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)  # View over the DIB bits
+        self.size = (width, height)
+    
+    def delete(self):
+        gdi32.SelectObject(self.dc, self.old_bitmap)
+        gdi32.DeleteObject(self.bitmap)
+        gdi32.DeleteDC(self.dc)
+
+class WindowCapture:
+    """Persistent capture target for a single window.
+
+    The memory DC and 32bpp DIB section are created once and reused for every
+    frame, so a capture is just PrintWindow into memory we already own. They
+    are only rebuilt when the window grows past the allocated size; smaller
+    frames are read out of the top-left corner.
+    
+    grab() returns UNCHANGED instead of an image when the rendered pixels are
+    identical to the previous frame.
+    
+    grab() holds the lock across PrintWindow, which blocks while the target
+    app is hung, so close() and forget_frame() never wait on it: they set a
+    flag that the grab in flight (or the next one) acts on.
+    """
+    UNCHANGED = object()
+    
+    def __init__(self, hwnd):
+        self.hwnd = hwnd
+        self.lock = threading.Lock()
+        self.closed = False
+        self.surface = None  # Full-size capture _DibSurface
+        self.thumb_surface = None  # Thumbnail-size target for GDI halftone scaling
+        self.last_frame = None  # (size, checksum) of the last frame returned
+        self.frame_stale = False  # Set by forget_frame(), consumed by the next grab
+    
+    @property
+    def size(self):
+        """Allocated DIB size, at least as large as any frame read from it"""
+        return self.surface.size if self.surface else (0, 0)
+    
+    def _allocate(self, width, height):
+        if self.surface:
+            self.surface.delete()
+            self.surface = None
+        self.surface = _DibSurface(width, height)
+    
+    def _release(self):
+        for surface in (self.surface, self.thumb_surface):
+            if surface:
+                surface.delete()
+        self.surface = None
+        self.thumb_surface = None
+    
+    def _checksum(self, width, height, stride):
+        """CRC of the width x height frame only, not the whole allocated DIB"""
+        pixels = memoryview(self.surface.pixels)
+        row_bytes = width * 4
+        if row_bytes == stride:
+            return zlib.crc32(pixels[:height * stride])  # Rows are contiguous
+        crc = 0
+        for offset in range(0, height * stride, stride):
+            crc = zlib.crc32(pixels[offset:offset + row_bytes], crc)
+        return crc
+    
+    def _halftone(self, width, height, size):
+        """Scale the captured frame down to size inside GDI and return it as RGB"""
+        if self.thumb_surface is None or self.thumb_surface.size != size:
+            if self.thumb_surface:
+                self.thumb_surface.delete()
+                self.thumb_surface = None
+            self.thumb_surface = _DibSurface(*size)
+        
+        thumb_dc = self.thumb_surface.dc
+        gdi32.SetStretchBltMode(thumb_dc, HALFTONE)
+        gdi32.SetBrushOrgEx(thumb_dc, 0, 0, None)  # Required after selecting HALFTONE
+        if not gdi32.StretchBlt(thumb_dc, 0, 0, size[0], size[1],
+                                self.surface.dc, 0, 0, width, height, SRCCOPY):
+            return None
+        gdi32.GdiFlush()
+        # Decoding BGRX copies the pixels out, so the image is safe once the lock drops
+        return Image.frombuffer('RGB', size, self.thumb_surface.pixels, 'raw', 'BGRX', 0, 1)
+    
+    def grab(self, width, height, size, resample=Image.LANCZOS):
+        """Render the window into the DIB and return it shrunk to size as an RGB image.
+        
+        resample=None scales with GDI's HALFTONE StretchBlt instead of Pillow,
+        so Pillow only ever sees thumbnail-sized pixels. Returns None on failure.
+        """
+        try:
+            with self.lock:
+                if self.closed:
+                    return None
+                return self._grab(width, height, size, resample)
+        finally:
+            # A close() that found the lock held left the DIBs to this grab
+            self._release_if_closed()
+    
+    def _grab(self, width, height, size, resample):
+        """grab() body; runs with the lock held"""
+        alloc_width, alloc_height = self.size
+        if width > alloc_width or height > alloc_height:
+            self._allocate(max(width, alloc_width), max(height, alloc_height))
+            alloc_width = self.size[0]
+        
+        if windll.user32.PrintWindow(self.hwnd, self.surface.dc, PW_CLIENTONLY_FULLCONTENT) != 1:
+            return None
+        gdi32.GdiFlush()
+        
+        # A checksum of the raw pixels is far cheaper than decoding and
+        # resizing a frame the viewer is already showing
+        checksum = ((width, height), self._checksum(width, height, alloc_width * 4))
+        if self.frame_stale:
+            self.frame_stale = False
+            self.last_frame = None
+        if checksum == self.last_frame:
+            return self.UNCHANGED
+        # Only recorded once an image comes back, so a failed scale is retried
+        self.last_frame = None
+        
+        if resample is None:
+            thumb = self._halftone(width, height, size)
+            if thumb is not None:
+                self.last_frame = checksum
+            return thumb
+        
+        # Map the DIB as an RGBX image without copying or decoding it, and
+        # shrink that. The bands are really BGRX, which is put right once
+        # the image is thumbnail-sized, by re-reading its bytes through
+        # the BGRX unpacker in a single pass. The mapped frame must not
+        # outlive the lock, since the next grab draws over it.
+        frame = Image.frombuffer('RGBX', (width, height), self.surface.pixels, 'raw', 'RGBX', alloc_width * 4, 1)
+        thumb = shrink_to_thumbnail(frame, size, resample)
+        thumb = Image.frombytes('RGB', thumb.size, thumb.tobytes(), 'raw', 'BGRX')
+        self.last_frame = checksum
+        return thumb
+    
+    def forget_frame(self):
+        """Make the next grab() return an image even if nothing changed"""
+        self.frame_stale = True
+    
+    def close(self):
+        """Stop capturing; the DIBs are freed now, or by the grab in flight"""
+        self.closed = True
+        self._release_if_closed()
+    
+    def _release_if_closed(self):
+        # Both close() and grab() set/check closed before trying the lock, so
+        # whichever gets the lock last after close() frees the DIBs
+        if self.closed and self.lock.acquire(blocking=False):
+            try:
+                self._release()
+            finally:
+                self.lock.release()
+
+# WinEvent hook prototypes for tracking window state without polling
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MINIMIZESTART = 0x0016
+EVENT_SYSTEM_MINIMIZEEND = 0x0017
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+
+user32 = windll.user32
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WINEVENTPROC,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+
+class WindowEventWatcher:
+    """Delivers WinEvents about whole windows from a dedicated hook thread.
+    
+    Out-of-context hooks call back on the thread that installed them while it
+    waits for messages, so the watcher owns a thread running a message loop.
+    Handlers are called on that thread as handler(event, hwnd).
+    """
+    def __init__(self, event_ranges):
+        self.event_ranges = event_ranges
+        self.handlers = []
+        self.hooked = False
+        self._thread_id = None
+        self._proc = WINEVENTPROC(self._callback)  # Must outlive the hooks
+    
+    def add_handler(self, handler):
+        self.handlers.append(handler)
+    
+    def start(self):
+        """Install the hooks; returns False if Windows refused them"""
+        ready = threading.Event()
+        threading.Thread(target=self._run, args=(ready,), daemon=True).start()
+        ready.wait(2)
+        return self.hooked
+    
+    def stop(self):
+        if self._thread_id:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+    
+    def _run(self, ready):
+        self._thread_id = windll.kernel32.GetCurrentThreadId()
+        hooks = [
+            user32.SetWinEventHook(first, last, None, self._proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+            for first, last in self.event_ranges
+        ]
+        self.hooked = all(hooks)
+        ready.set()
+        
+        try:
+            msg = wintypes.MSG()
+            while self.hooked and user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                pass
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+    
+    def _callback(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        # Ignore events about carets, cursors, scrollbars and other sub-objects
+        if not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        for handler in self.handlers:
+            try:
+                handler(event, hwnd)
+            except Exception as e:
+                logging.error(f"Error handling window event {event:#x} for {hwnd}: {e}")
+
+def _rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
+    """Draw a rounded rectangle as a smoothed polygon.
+    
+    The corner vertices are the spline control points that round each corner,
+    and the doubled tangent points keep the edges between them straight.
+    """
+    points = [
+        x1+radius, y1,
+        x1+radius, y1,
+        x2-radius, y1,
+        x2-radius, y1,
+        x2, y1,
+        x2, y1+radius,
+        x2, y1+radius,
+        x2, y2-radius,
+        x2, y2-radius,
+        x2, y2,
+        x2-radius, y2,
+        x2-radius, y2,
+        x1+radius, y2,
+        x1+radius, y2,
+        x1, y2,
+        x1, y2-radius,
+        x1, y2-radius,
+        x1, y1+radius,
+        x1, y1+radius,
+        x1, y1
+    ]
+    return canvas.create_polygon(points, smooth=True, **kwargs)
+
 class ModernButton(tk.Canvas):
     """Custom modern button with hover effects"""
     def __init__(self, parent, text, command, bg="#007AFF", fg="white", hover_bg="#0051D5", width=120, **kwargs):
@@ -237,53 +755,43 @@ class ModernButton(tk.Canvas):
         self.is_hovered = False
         self.button_width = width
         
+        # Create the canvas items once; hover and state changes only recolor them
+        self._bg_id = self.create_rounded_rect(2, 2, width-2, 36-2, 8, fill=bg, outline="")
+        self._text_id = self.create_text(width//2, 36//2, text=text, fill=fg, font=("Segoe UI", 10, "bold"))
+        
         self.bind("<Button-1>", lambda e: command())
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
-        self.bind("<Configure>", lambda e: self.draw())
+        self.bind("<Configure>", lambda e: self.sync_background())
         
-        self.after(10, self.draw)
+        self.after(10, self.sync_background)
     
-    def draw(self):
-        self.delete("all")
-        color = self.hover_bg if self.is_hovered else self.bg
+    def sync_background(self):
+        """Match the canvas background to the parent widget"""
         try:
             parent_bg = self.master.cget('bg')
             self.configure(bg=parent_bg)
         except:
             pass
-        
-        width = self.button_width
-        height = 36
-        
-        radius = 8
-        self.create_rounded_rect(2, 2, width-2, height-2, radius, fill=color, outline="")
-        self.create_text(width//2, height//2, text=self.text, fill=self.fg, font=("Segoe UI", 10, "bold"))
+    
+    def draw(self):
+        color = self.hover_bg if self.is_hovered else self.bg
+        self.itemconfig(self._bg_id, fill=color)
+    
+    def retheme(self, bg=None, hover_bg=None, fg=None):
+        """Recolor the existing canvas items for a new theme"""
+        if bg is not None:
+            self.bg = bg
+        if hover_bg is not None:
+            self.hover_bg = hover_bg
+        if fg is not None:
+            self.fg = fg
+            self.itemconfig(self._text_id, fill=fg)
+        self.sync_background()
+        self.draw()
     
     def create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        points = [
-            x1+radius, y1,
-            x1+radius, y1,
-            x2-radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        return _rounded_rect(self, x1, y1, x2, y2, radius, **kwargs)
     
     def on_enter(self, e):
         self.is_hovered = True
@@ -309,11 +817,11 @@ class ModernToggle(tk.Frame):
         self.bg_color = parent_bg
         self.text_color = text_color if text_color else "white"
         
-        container = tk.Frame(self, bg=self.bg_color)
-        container.pack(padx=10, pady=5)
+        self.container = tk.Frame(self, bg=self.bg_color)
+        self.container.pack(padx=10, pady=5)
         
         self.label = tk.Label(
-            container,
+            self.container,
             text=text,
             font=("Segoe UI", 10),
             fg=self.text_color,
@@ -322,7 +830,7 @@ class ModernToggle(tk.Frame):
         self.label.pack(side=tk.LEFT, padx=(0, 10))
         
         self.toggle_canvas = tk.Canvas(
-            container,
+            self.container,
             width=50,
             height=26,
             bg=self.bg_color,
@@ -334,29 +842,41 @@ class ModernToggle(tk.Frame):
         self.toggle_canvas.bind("<Button-1>", self.toggle)
         self.label.bind("<Button-1>", self.toggle)
         
+        # Track and knob are created once; draw_toggle only recolors and moves them
+        self._track_id = self._create_rounded_rect(
+            self.toggle_canvas,
+            2, 2, 48, 24, 12,
+            fill="#3a3a3a",
+            outline=""
+        )
+        self._knob_id = self.toggle_canvas.create_oval(7, 5, 23, 21, fill="white", outline="")
+        
         self.draw_toggle()
         
         self.variable.trace_add("write", lambda *args: self.draw_toggle())
     
     def draw_toggle(self):
-        self.toggle_canvas.delete("all")
         is_on = self.variable.get()
         
         bg_color = get_setting("accent_color", "#007AFF") if is_on else "#3a3a3a"
-        self._create_rounded_rect(
-            self.toggle_canvas,
-            2, 2, 48, 24, 12,
-            fill=bg_color,
-            outline=""
-        )
+        self.toggle_canvas.itemconfig(self._track_id, fill=bg_color)
         
         circle_x = 35 if is_on else 15
-        self.toggle_canvas.create_oval(
-            circle_x - 8, 5,
-            circle_x + 8, 21,
-            fill="white",
-            outline=""
-        )
+        self.toggle_canvas.coords(self._knob_id, circle_x - 8, 5, circle_x + 8, 21)
+    
+    def retheme(self, text_color=None):
+        """Pick up the parent's new background and the theme's text colour"""
+        try:
+            self.bg_color = self.master.cget('bg')
+        except:
+            pass
+        if text_color is not None:
+            self.text_color = text_color
+        
+        for widget in (self, self.container, self.toggle_canvas):
+            widget.configure(bg=self.bg_color)
+        self.label.configure(fg=self.text_color, bg=self.bg_color)
+        self.draw_toggle()
     
     def toggle(self, event=None):
         self.variable.set(not self.variable.get())
@@ -364,29 +884,29 @@ class ModernToggle(tk.Frame):
             self.command()
     
     def _create_rounded_rect(self, canvas, x1, y1, x2, y2, radius, **kwargs):
-        points = [
-            x1+radius, y1,
-            x1+radius, y1,
-            x2-radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return canvas.create_polygon(points, smooth=True, **kwargs)
+        return _rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs)
+
+@dataclasses.dataclass(slots=True)
+class ClientState:
+    """Everything PiPBoard tracks for one monitored window"""
+    title: str
+    frame: tk.Widget
+    label: tk.Label
+    title_label: tk.Label
+    status_indicator: tk.Canvas
+    status_oval_id: int
+    cpu_label: tk.Label
+    photo: ImageTk.PhotoImage
+    capture: WindowCapture
+    pid: int | None = None
+    row: int = 0
+    col: int = 0
+    is_minimized: bool = False
+    cpu_usage: float = 0.0
+    shown_cpu: float | None = None  # Last value drawn on cpu_label; None forces a redraw
+    next_capture_ts: float = 0.0
+    static_frames: int = 0  # Identical frames captured in a row
+    last_capture_ok: float = 0.0  # time.time() of the last PrintWindow that succeeded
 
 class PiPBoard:
     def __init__(self):
@@ -436,87 +956,169 @@ class PiPBoard:
         
         self.fps = 20
         self.movie_mode = False
+        # Thumbnail scaling: None = GDI HALFTONE (default, see WindowCapture.grab);
+        # a Pillow filter here is used for the final (< 2x) resize step instead
+        self.thumb_resample = None
         self.paused = False
         self.capture_scale = 0.5
+        # Minimized windows keep showing their last snapshot unless this is set
+        self.capture_when_minimized = False
         
         self.clients = {}
-        self.running = True
-        self.paused_clients = set()
-        self.expanded_windows = set()
+        # Widgets of removed cards, kept hidden for the next add_client
+        self._card_pool = []
+        self.client_order = []  # hwnds in grid order; index is the card's slot
+        self._proc_cache = {}  # pid -> psutil.Process, shared by clients of the same process
+        self._stop = threading.Event()  # Set once on shutdown; wakes every worker loop
+        # Immutable sets, rebound under expanded_lock on change; readers take no lock
+        self.paused_clients = frozenset()
+        self.expanded_windows = frozenset()
         
         self.client_lock = threading.Lock()
-        self.expanded_lock = threading.Lock()
+        # Read-only copy of self.clients, rebuilt under client_lock whenever a
+        # client is added or removed. Readers use it without taking the lock.
+        self._clients_snapshot = MappingProxyType({})
+        self.expanded_lock = threading.Lock()  # Serializes writers of paused_clients/expanded_windows
         
         self.ui_queue = queue.Queue()
+        self._pending_frames = {}  # hwnd -> latest thumbnail not yet shown, guarded by client_lock
+        self._regrid_pending = False
+        
+        self._window_list_cache = (float("-inf"), [])  # (taken_at, windows) for the Add Window list
+        # Only low-rate system events are hooked; object create/name-change events
+        # fire constantly across the desktop and the Add Window list is rarely open
+        self.window_events = WindowEventWatcher([
+            (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND),
+            (EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND),
+        ])
+        self.window_events.add_handler(self._queue_window_event)
+        # Minimize/restore and foreground events, consumed by process_window_events
+        self.window_event_queue = queue.Queue()
+        
+        # Lets the capture thread park while every client is paused/minimized
+        self.capture_sleeper = AdaptiveSleeper(self._stop)
+        # PrintWindow and the PIL resize release the GIL, so clients capture in parallel
+        self._cap_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                            thread_name_prefix="capture")
+        self.viewer_hidden = False
         
         self.debug_panel_visible = False
         self.debug_panel = None
+        self._refresh_logs_job = None
+        
+        # Dialogs kept alive between uses (see show_settings_dialog / _show_window_dialog)
+        self._settings_dialog = None
+        self._applied_look = (self.current_theme, self.accent_color)  # Colours the widgets are drawn with
+        self._settings_dialog_key = None
+        self._refresh_settings_dialog = None
+        self._add_window_dialog = None
+        self._add_window_choices = []
+        
+        # (widget, {option: theme attribute}) pairs recolored in place by apply_theme
+        self._themed_widgets = []
         
         # Calculate initial thumbnail size
         self.calculate_thumbnail_size()
         
+        self.style = ttk.Style(self.root)
+        self.configure_styles()
+        
         # Setup UI
         self.setup_modern_ui()
         
         self.process_ui_queue()
         
+        self.root.bind("<Map>", self.on_viewer_visibility, add="+")
+        self.root.bind("<Unmap>", self.on_viewer_visibility, add="+")
+        self.root.bind("<FocusIn>", lambda e: self.capture_sleeper.mark_active(), add="+")
+        
         # Restore position after UI is fully loaded
         self.root.after(200, self.restore_window_position)
         
         # Start threads
         self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
         self.capture_thread.start()
+        self._workers = [self.capture_thread]
         
-        self.monitor_thread = threading.Thread(target=self.monitor_expanded_windows, daemon=True)
-        self.monitor_thread.start()
-        
-        self.status_monitor_thread = threading.Thread(target=self.monitor_window_states, daemon=True)
-        self.status_monitor_thread.start()
+        if self.window_events.start():
+            # Window state and foreground changes arrive as events; nothing to poll
+            self.window_event_thread = threading.Thread(target=self.process_window_events, daemon=True)
+            self.window_event_thread.start()
+            self._workers.append(self.window_event_thread)
+        else:
+            logging.warning("WinEvent hook unavailable; falling back to polling window state")
+            
+            self.monitor_thread = threading.Thread(target=self.monitor_expanded_windows, daemon=True)
+            self.monitor_thread.start()
+            
+            self.status_monitor_thread = threading.Thread(target=self.monitor_window_states, daemon=True)
+            self.status_monitor_thread.start()
+            self._workers += [self.monitor_thread, self.status_monitor_thread]
         
         self.cpu_monitor_thread = threading.Thread(target=self.monitor_cpu_usage, daemon=True)
         self.cpu_monitor_thread.start()
+        self._workers.append(self.cpu_monitor_thread)
         
-        check_updates_on_startup()
+        # Settle the UI and first captures before talking to GitHub
+        self.root.after(STARTUP_UPDATE_CHECK_DELAY_MS, check_updates_on_startup, self.queue_ui_update)
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def compute_thumbnail_size(self):
+        """Work out the thumbnail size for the current grid columns and screen size"""
+        screen_width = self.root.winfo_screenwidth()
+        
+        # Calculate available width (accounting for window borders, padding, scrollbar)
+        window_padding = 60  # Total horizontal padding in window
+        scrollbar_width = 20  # Scrollbar width
+        card_margin = 24  # Total margin per card (12px each side)
+        card_internal_padding = 30  # Padding inside card
+        
+        # Available width for all columns
+        available_width = screen_width - window_padding - scrollbar_width
+        
+        # Calculate width per column
+        width_per_column = available_width / self.grid_columns
+        
+        # Calculate actual thumbnail width
+        thumbnail_width = int(width_per_column - card_margin - card_internal_padding)
+        
+        # Ensure reasonable size constraints
+        thumbnail_width = max(180, min(thumbnail_width, 600))
+        
+        # Calculate height (4:3 aspect ratio)
+        thumbnail_height = int(thumbnail_width * 0.75)
+        
+        return (thumbnail_width, thumbnail_height), screen_width
+    
     def calculate_thumbnail_size(self):
-        """Calculate optimal thumbnail size based on grid columns and screen size"""
+        """Calculate optimal thumbnail size based on grid columns and screen size.
+        
+        Returns True if the size changed.
+        """
         try:
-            # Get screen width
-            self.root.update_idletasks()
-            screen_width = self.root.winfo_screenwidth()
-            
-            # Calculate available width (accounting for window borders, padding, scrollbar)
-            window_padding = 60  # Total horizontal padding in window
-            scrollbar_width = 20  # Scrollbar width
-            card_margin = 24  # Total margin per card (12px each side)
-            card_internal_padding = 30  # Padding inside card
-            
-            # Available width for all columns
-            available_width = screen_width - window_padding - scrollbar_width
+            new_size, screen_width = self.compute_thumbnail_size()
             
-            # Calculate width per column
-            width_per_column = available_width / self.grid_columns
-            
-            # Calculate actual thumbnail width
-            thumbnail_width = int(width_per_column - card_margin - card_internal_padding)
-            
-            # Ensure reasonable size constraints
-            thumbnail_width = max(180, min(thumbnail_width, 600))
-            
-            # Calculate height (4:3 aspect ratio)
-            thumbnail_height = int(thumbnail_width * 0.75)
+            if new_size == getattr(self, "current_thumbnail_size", None):
+                return False
             
             # Store as tuple
-            self.current_thumbnail_size = (thumbnail_width, thumbnail_height)
+            self.current_thumbnail_size = new_size
             
             logging.info(f"Calculated thumbnail size: {self.current_thumbnail_size} for {self.grid_columns} columns (screen: {screen_width}px)")
+            return True
             
         except Exception as e:
             logging.error(f"Error calculating thumbnail size: {e}")
             # Fallback to medium size
             self.current_thumbnail_size = (320, 240)
+            return True
+    
+    def configure_styles(self):
+        """Set the theme colours on the shared ttk frame styles"""
+        self.style.configure("App.TFrame", background=self.bg_color)
+        self.style.configure("Card.TFrame", background=self.card_bg)
+        self.style.configure("Thumb.TFrame", background="#000000")
     
     def on_window_configure(self, event):
         """Save window position when moved"""
@@ -525,6 +1127,31 @@ class PiPBoard:
             if hasattr(self, '_save_position_job'):
                 self.root.after_cancel(self._save_position_job)
             self._save_position_job = self.root.after(500, self._save_window_position)
+            
+            # The screen can change when the window moves monitors; check once it settles
+            if hasattr(self, '_resize_job'):
+                self.root.after_cancel(self._resize_job)
+            self._resize_job = self.root.after(200, self._maybe_recalc_thumbnails)
+    
+    def _maybe_recalc_thumbnails(self):
+        """Rebuild the cards only when the thumbnail width moves by more than 10%"""
+        try:
+            new_size, _ = self.compute_thumbnail_size()
+        except Exception as e:
+            logging.error(f"Error calculating thumbnail size: {e}")
+            return
+        
+        old_width = self.current_thumbnail_size[0]
+        if abs(new_size[0] - old_width) > old_width * 0.1:
+            self.calculate_thumbnail_size()
+            self.resize_cards()
+    
+    def on_viewer_visibility(self, event):
+        """Stop capturing while the viewer itself is minimized"""
+        if event.widget == self.root:
+            self.viewer_hidden = (event.type == tk.EventType.Unmap)
+            if not self.viewer_hidden:
+                self.capture_sleeper.mark_active()
     
     def _save_window_position(self):
         """Actually save the window position"""
@@ -593,24 +1220,45 @@ class PiPBoard:
     def process_ui_queue(self):
         """Process UI updates from background threads safely"""
         try:
-            while not self.ui_queue.empty():
+            # Drain a bounded batch; per-client updates are keyed so only the newest survives
+            max_items = max(UI_QUEUE_MIN_BATCH, 2 * len(self.clients))
+            pending = {}
+            for _ in range(max_items):
                 try:
-                    func, args, kwargs = self.ui_queue.get_nowait()
-                    func(*args, **kwargs)
+                    key, func, args, kwargs = self.ui_queue.get_nowait()
                 except queue.Empty:
                     break
+                pending[key if key is not None else object()] = (func, args, kwargs)
+            
+            for func, args, kwargs in pending.values():
+                try:
+                    func(*args, **kwargs)
                 except Exception as e:
                     logging.error(f"Error processing UI queue item: {e}")
+            
+            if pending:
+                self.root.update_idletasks()
         except Exception as e:
             logging.error(f"Error in process_ui_queue: {e}")
         finally:
-            if self.running:
-                self.root.after(50, self.process_ui_queue)
+            if not self._stop.is_set():
+                if not self.ui_queue.empty():
+                    # Backlog left over - continue as soon as Tk is idle
+                    self.root.after_idle(self.process_ui_queue)
+                else:
+                    self.root.after(50, self.process_ui_queue)
     
     def queue_ui_update(self, func, *args, **kwargs):
         """Queue a UI update to be executed on the main thread"""
         try:
-            self.ui_queue.put((func, args, kwargs))
+            self.ui_queue.put((None, func, args, kwargs))
+        except Exception as e:
+            logging.error(f"Error queuing UI update: {e}")
+    
+    def queue_client_update(self, hwnd, func, *args):
+        """Queue a per-client UI update; a newer update for the same client replaces an unprocessed one"""
+        try:
+            self.ui_queue.put(((func.__name__, hwnd), func, (hwnd,) + args, {}))
         except Exception as e:
             logging.error(f"Error queuing UI update: {e}")
     
@@ -627,75 +1275,60 @@ class PiPBoard:
         self.toggle_text = self.themes[self.current_theme]["toggle_text"]
         
         self.root.configure(bg=self.bg_color)
+        self.configure_styles()
+        self._applied_look = (self.current_theme, self.accent_color)
+        
+        # Recolor the existing widgets in registration order, so parents are
+        # done before the custom widgets that copy their background
+        live = []
+        for widget, spec in self._themed_widgets:
+            if not widget.winfo_exists():
+                continue
+            colors = {option: getattr(self, attr) for option, attr in spec.items()}
+            if hasattr(widget, "retheme"):
+                widget.retheme(**colors)
+            else:
+                widget.configure(**colors)
+            live.append((widget, spec))
+        self._themed_widgets = live
         
         # Recalculate thumbnail size
         self.calculate_thumbnail_size()
-        
-        # Store current clients data before destroying widgets
-        with self.client_lock:
-            clients_copy = list(self.clients.items())
-        
-        # Destroy all widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Recreate UI
-        self.setup_modern_ui()
-        
-        # Recreate all client cards
-        for hwnd, client_data in clients_copy:
-            self.recreate_client_card(hwnd, client_data)
+        self.resize_cards()
     
-    def recreate_client_card(self, hwnd, old_data):
-        """Recreate a client card with current theme"""
-        position = old_data["position"]
-        title = old_data["title"]
-        
-        row = position // self.grid_columns
-        col = position % self.grid_columns
-        
-        card, img_label, controls, title_label, status_indicator, cpu_label = self.create_modern_card(
-            self.scrollable_frame,
-            title,
-            position + 1
-        )
-        
-        card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
-        
-        self.scrollable_frame.grid_columnconfigure(col, weight=1, minsize=self.current_thumbnail_size[0] + 30)
-        
-        img_label.bind('<Button-1>', lambda e: self.expand_pip(hwnd))
-        
-        btn_frame = tk.Frame(controls, bg=self.card_bg)
-        btn_frame.pack(side=tk.LEFT)
-        
-        up_btn = tk.Label(btn_frame, text="↑", fg=self.text_color, bg=self.card_bg, cursor="hand2", font=("Segoe UI", 12), padx=10)
-        up_btn.pack(side=tk.LEFT, padx=2)
-        up_btn.bind("<Button-1>", lambda e: self.move_client(hwnd, -1))
+    def themed(self, widget, **spec):
+        """Register a widget whose colours follow the theme.
+        
+        spec maps a widget option to the attribute holding its colour,
+        e.g. themed(label, fg="text_color", bg="card_bg").
+        """
+        self._themed_widgets.append((widget, spec))
+        return widget
+    
+    def resize_cards(self):
+        """Resize every card's image area to the current thumbnail size"""
+        thumb_width, thumb_height = self.current_thumbnail_size
+        cards = [(data.label, data.capture) for data in self._clients_snapshot.values()]
         
-        down_btn = tk.Label(btn_frame, text="↓", fg=self.text_color, bg=self.card_bg, cursor="hand2", font=("Segoe UI", 12), padx=10)
-        down_btn.pack(side=tk.LEFT, padx=2)
-        down_btn.bind("<Button-1>", lambda e: self.move_client(hwnd, 1))
+        # The label sits in a fixed-size container; frames of the old size are
+        # replaced by update_client_image on the next capture
+        for img_label, capture in cards:
+            img_label.master.configure(width=thumb_width, height=thumb_height)
+            capture.forget_frame()  # Static windows still need a frame at the new size
         
-        remove_btn = tk.Label(controls, text="✕ Remove", fg="#ff4444", bg=self.card_bg, cursor="hand2", font=("Segoe UI", 9))
-        remove_btn.pack(side=tk.RIGHT)
-        remove_btn.bind("<Button-1>", lambda e: self.remove_client(hwnd))
-        
-        with self.client_lock:
-            self.clients[hwnd].update({
-                "frame": card,
-                "label": img_label,
-                "title_label": title_label,
-                "status_indicator": status_indicator,
-                "cpu_label": cpu_label,
-                "row": row,
-                "col": col
-            })
+        self.reorganize_grid()
+    
+    def attach_thumbnail_photo(self, img_label):
+        """Give a card's image label a PhotoImage that frames are pasted into"""
+        photo = ImageTk.PhotoImage('RGB', self.current_thumbnail_size)
+        img_label.configure(image=photo)
+        img_label.image = photo
+        return photo
     
     def setup_modern_ui(self):
         self.root.configure(bg=self.bg_color)
         
-        header = tk.Frame(self.root, bg=self.bg_color, height=80)
+        header = ttk.Frame(self.root, style="App.TFrame", height=80)
         header.pack(side=tk.TOP, fill=tk.X)
         header.pack_propagate(False)
         
@@ -707,54 +1340,66 @@ class PiPBoard:
             bg=self.bg_color
         )
         title_label.pack(side=tk.LEFT, padx=30, pady=20)
+        self.themed(title_label, fg="text_color", bg="bg_color")
         
         controls = tk.Frame(header, bg=self.bg_color)
         controls.pack(side=tk.RIGHT, padx=30, pady=20)
+        self.themed(controls, bg="bg_color")
         
         add_btn = ModernButton(controls, "＋ Add Window", self.add_window, bg=self.accent_color, width=150)
         add_btn.pack(side=tk.LEFT, padx=5)
+        self.themed(add_btn, bg="accent_color")
         
         self.movie_mode_var = tk.BooleanVar(value=False)
         self.movie_toggle = self.create_toggle_button(controls, "🎬 Movie Mode", self.movie_mode_var, self.toggle_movie_mode)
         self.movie_toggle.pack(side=tk.LEFT, padx=8)
+        self.themed(self.movie_toggle, text_color="toggle_text")
         
         self.auto_minimize_var = tk.BooleanVar(value=True)
         self.auto_toggle = self.create_toggle_button(controls, "⚡ Auto-Minimize", self.auto_minimize_var, None)
         self.auto_toggle.pack(side=tk.LEFT, padx=8)
+        self.themed(self.auto_toggle, text_color="toggle_text")
         
         utility_frame = tk.Frame(controls, bg=self.bg_color)
         utility_frame.pack(side=tk.LEFT, padx=15)
+        self.themed(utility_frame, bg="bg_color")
         
         settings_btn = ModernButton(utility_frame, "⚙️ Settings", self.show_settings_dialog, 
                                      bg=self.button_bg, hover_bg=self.button_hover, 
                                      fg=self.button_text, width=120)
         settings_btn.pack(side=tk.LEFT, padx=3)
+        self.themed(settings_btn, bg="button_bg", hover_bg="button_hover", fg="button_text")
         
-        updates_btn = ModernButton(utility_frame, "🔄 Updates", lambda: check_for_updates(show_no_update_message=True), 
+        updates_btn = ModernButton(utility_frame, "🔄 Updates", lambda: check_for_updates_in_background(self.queue_ui_update, show_no_update_message=True), 
                                    bg=self.button_bg, hover_bg=self.button_hover, 
                                    fg=self.button_text, width=120)
         updates_btn.pack(side=tk.LEFT, padx=3)
+        self.themed(updates_btn, bg="button_bg", hover_bg="button_hover", fg="button_text")
         
         help_btn = ModernButton(utility_frame, "❓ Help", self.show_help_dialog, 
                                 bg=self.button_bg, hover_bg=self.button_hover, 
                                 fg=self.button_text, width=100)
         help_btn.pack(side=tk.LEFT, padx=3)
+        self.themed(help_btn, bg="button_bg", hover_bg="button_hover", fg="button_text")
         
         chatgpt_btn = ModernButton(utility_frame, "💬 ChatGPT", self.open_chatgpt, 
                                    bg="#10a37f", hover_bg="#0d8c6d", 
                                    fg="white", width=120)
         chatgpt_btn.pack(side=tk.LEFT, padx=3)
+        self.themed(chatgpt_btn)  # Fixed colours; only the canvas behind it follows the theme
         
         debug_btn = ModernButton(utility_frame, "🐛 Debug", self.toggle_debug_panel, 
                                  bg="#444444", hover_bg="#333333", width=110)
         debug_btn.pack(side=tk.LEFT, padx=3)
+        self.themed(debug_btn)  # Fixed colours; only the canvas behind it follows the theme
         
-        status_frame = tk.Frame(controls, bg=self.bg_color)
+        status_frame = ttk.Frame(controls, style="App.TFrame")
         status_frame.pack(side=tk.LEFT, padx=15)
         
         self.status_dot = tk.Canvas(status_frame, width=12, height=12, bg=self.bg_color, highlightthickness=0)
-        self.status_dot.create_oval(2, 2, 10, 10, fill="#00ff00", outline="")
+        self.status_dot_oval = self.status_dot.create_oval(2, 2, 10, 10, fill="#00ff00", outline="")
         self.status_dot.pack(side=tk.LEFT, padx=5)
+        self.themed(self.status_dot, bg="bg_color")
         
         self.status_label = tk.Label(
             status_frame,
@@ -764,13 +1409,15 @@ class PiPBoard:
             font=("Segoe UI", 10, "bold")
         )
         self.status_label.pack(side=tk.LEFT)
+        self.themed(self.status_label, bg="bg_color")
         
-        content = tk.Frame(self.root, bg=self.bg_color)
+        content = ttk.Frame(self.root, style="App.TFrame")
         content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
         self.canvas = tk.Canvas(content, bg=self.bg_color, highlightthickness=0)
+        self.themed(self.canvas, bg="bg_color")
 
-        self.scrollable_frame = tk.Frame(self.canvas, bg=self.bg_color)
+        self.scrollable_frame = ttk.Frame(self.canvas, style="App.TFrame")
 
         self.scrollable_frame.bind(
             "<Configure>",
@@ -782,11 +1429,11 @@ class PiPBoard:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Create scroll button container on the right
-        scroll_buttons = tk.Frame(content, bg=self.bg_color, width=50)
+        scroll_buttons = ttk.Frame(content, style="App.TFrame", width=50)
         scroll_buttons.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Add vertical spacer to center the buttons
-        tk.Frame(scroll_buttons, bg=self.bg_color).pack(side=tk.TOP, expand=True)
+        ttk.Frame(scroll_buttons, style="App.TFrame").pack(side=tk.TOP, expand=True)
 
         # Up arrow button
         up_arrow = tk.Label(
@@ -800,6 +1447,7 @@ class PiPBoard:
             pady=5
         )
         up_arrow.pack(side=tk.TOP, pady=5)
+        self.themed(up_arrow, fg="accent_color", bg="bg_color")
 
         def scroll_up(event=None):
             self.canvas.yview_scroll(-3, "units")
@@ -818,6 +1466,7 @@ class PiPBoard:
             pady=5
         )
         down_arrow.pack(side=tk.TOP, pady=5)
+        self.themed(down_arrow, fg="accent_color", bg="bg_color")
 
         def scroll_down(event=None):
             self.canvas.yview_scroll(3, "units")
@@ -825,25 +1474,59 @@ class PiPBoard:
         down_arrow.bind("<Button-1>", scroll_down)
 
         # Add vertical spacer to center the buttons
-        tk.Frame(scroll_buttons, bg=self.bg_color).pack(side=tk.TOP, expand=True)
+        ttk.Frame(scroll_buttons, style="App.TFrame").pack(side=tk.TOP, expand=True)
 
         # Add mouse wheel scrolling
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self.bind_wheel_scrolling(self.canvas)
         
         self.debug_panel = None
         self.debug_panel_visible = False
     
+    def bind_wheel_scrolling(self, canvas):
+        """Scroll canvas with the mouse wheel while the pointer is over it.
+        
+        The app-wide wheel binding only exists while the pointer is inside the
+        canvas, and wheel ticks are summed and applied in one scroll at idle.
+        """
+        pending = {"delta": 0, "job": None}
+        
+        def flush():
+            pending["job"] = None
+            if not canvas.winfo_exists():
+                return
+            units = int(-pending["delta"] / 120)
+            pending["delta"] += units * 120  # Keep partial ticks from precision touchpads
+            if units:
+                canvas.yview_scroll(units, "units")
+        
+        def on_wheel(event):
+            if not canvas.winfo_exists():
+                # Canvas went away without a <Destroy> reaching us; drop the global binding
+                canvas.unbind_all("<MouseWheel>")
+                return
+            pending["delta"] += event.delta
+            if pending["job"] is None:
+                pending["job"] = canvas.after_idle(flush)
+        
+        def on_leave(event):
+            # Moving onto a card inside the canvas also counts as leaving it
+            widget = canvas.winfo_containing(*canvas.winfo_pointerxy())
+            path = str(canvas)
+            if widget is None or (str(widget) != path and not str(widget).startswith(path + ".")):
+                canvas.unbind_all("<MouseWheel>")
+        
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_wheel), add="+")
+        canvas.bind("<Leave>", on_leave, add="+")
+        canvas.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>"), add="+")
+    
     def create_toggle_button(self, parent, text, variable, command):
         return ModernToggle(parent, text, variable, command, text_color=self.toggle_text)
     
     def create_modern_card(self, parent, title, position):
-        card = tk.Frame(parent, bg=self.card_bg, relief="flat", bd=0)
+        card = ttk.Frame(parent, style="Card.TFrame")
         
         # Header with title and CPU
-        header = tk.Frame(card, bg=self.card_bg, height=40)
+        header = ttk.Frame(card, style="Card.TFrame", height=40)
         header.pack(fill=tk.X, padx=15, pady=(15, 5))
         header.pack_propagate(False)
         
@@ -856,6 +1539,7 @@ class PiPBoard:
             anchor="w"
         )
         title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.themed(title_label, fg="text_color", bg="card_bg")
         
         cpu_label = tk.Label(
             header,
@@ -865,13 +1549,14 @@ class PiPBoard:
             bg=self.card_bg
         )
         cpu_label.pack(side=tk.RIGHT, padx=(10, 5))
+        self.themed(cpu_label, fg="text_secondary", bg="card_bg")
         
         # Image frame
-        img_frame = tk.Frame(card, bg="#000000", relief="flat")
+        img_frame = ttk.Frame(card, style="Thumb.TFrame")
         img_frame.pack(padx=15, pady=5)
         
         thumb_width, thumb_height = self.current_thumbnail_size
-        img_container = tk.Frame(img_frame, width=thumb_width, height=thumb_height, bg="#000000")
+        img_container = ttk.Frame(img_frame, style="Thumb.TFrame", width=thumb_width, height=thumb_height)
         img_container.pack()
         img_container.pack_propagate(False)
         
@@ -879,12 +1564,13 @@ class PiPBoard:
         img_label.pack(fill=tk.BOTH, expand=True)
         
         # Status indicator below image
-        status_frame = tk.Frame(card, bg=self.card_bg)
+        status_frame = ttk.Frame(card, style="Card.TFrame")
         status_frame.pack(fill=tk.X, padx=15, pady=(5, 5))
         
         status_indicator = tk.Canvas(status_frame, width=10, height=10, bg=self.card_bg, highlightthickness=0)
-        status_indicator.create_oval(2, 2, 8, 8, fill="#00ff00", outline="")
+        status_oval_id = status_indicator.create_oval(2, 2, 8, 8, fill="#00ff00", outline="")
         status_indicator.pack(side=tk.LEFT, padx=(0, 5))
+        self.themed(status_indicator, bg="card_bg")
         
         status_text = tk.Label(
             status_frame,
@@ -894,32 +1580,80 @@ class PiPBoard:
             bg=self.card_bg
         )
         status_text.pack(side=tk.LEFT)
+        self.themed(status_text, fg="text_secondary", bg="card_bg")
         
         # Controls at bottom
-        controls = tk.Frame(card, bg=self.card_bg)
+        controls = ttk.Frame(card, style="Card.TFrame")
         controls.pack(fill=tk.X, padx=15, pady=(5, 15))
         
-        return card, img_label, controls, title_label, status_indicator, cpu_label
+        return card, img_label, controls, title_label, status_indicator, status_oval_id, cpu_label
     
-    def get_window_list(self):
+    def _capturable_title(self, hwnd):
+        """Title of a visible top-level window worth listing, else None"""
+        if not win32gui.IsWindowVisible(hwnd):
+            return None
+        # Asking for the length first skips the buffer allocation for untitled windows
+        if not user32.GetWindowTextLengthW(hwnd):
+            return None
+        title = win32gui.GetWindowText(hwnd)
+        if not title or title == "Multi-Client Viewer":
+            return None
+        return title
+    
+    def _enum_top_windows(self):
         windows = []
         
         def callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
-                if title and title not in ["", "Multi-Client Viewer"]:
-                    windows.append((hwnd, title))
+            title = self._capturable_title(hwnd)
+            if title:
+                windows.append((hwnd, title))
             return True
         
         win32gui.EnumWindows(callback, windows)
         return windows
     
+    def _queue_window_event(self, event, hwnd):
+        """WinEvent handler handing state changes to the consumer thread"""
+        if event in (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_MINIMIZESTART, EVENT_SYSTEM_MINIMIZEEND):
+            self.window_event_queue.put((event, hwnd))
+    
+    def process_window_events(self):
+        """Apply minimize/restore and foreground changes reported by the hook"""
+        while True:
+            item = self.window_event_queue.get()
+            if item is None or self._stop.is_set():
+                return
+            
+            event, hwnd = item
+            try:
+                if event == EVENT_SYSTEM_FOREGROUND:
+                    client = self._clients_snapshot.get(hwnd)
+                    if client is not None:
+                        # Switch the new foreground client to full rate now, not when its
+                        # background interval runs out
+                        client.next_capture_ts = 0.0
+                        self.capture_sleeper.mark_active()
+                    if self.auto_minimize_var.get():
+                        self.minimize_expanded_except(hwnd)
+                else:
+                    self.set_client_minimized(hwnd, event == EVENT_SYSTEM_MINIMIZESTART)
+            except Exception as e:
+                logging.error(f"Error handling window event for {hwnd}: {e}")
+    
+    def get_window_list(self):
+        # Reuse a recent enumeration when the dialog is reopened in quick succession
+        taken_at, windows = self._window_list_cache
+        if time.monotonic() - taken_at >= WINDOW_LIST_TTL:
+            windows = self._enum_top_windows()
+            self._window_list_cache = (time.monotonic(), windows)
+        return [(hwnd, title) for hwnd, title in windows if win32gui.IsWindow(hwnd)]
+    
     def add_window(self):
         def get_windows_async():
             windows = self.get_window_list()
             
-            with self.client_lock:
-                available_windows = [(hwnd, title) for hwnd, title in windows if hwnd not in self.clients]
+            clients = self._clients_snapshot
+            available_windows = [(hwnd, title) for hwnd, title in windows if hwnd not in clients]
             
             self.queue_ui_update(self._show_window_dialog, available_windows)
         
@@ -932,6 +1666,19 @@ class PiPBoard:
             messagebox.showinfo("No Windows", "No new capturable windows found!")
             return
         
+        self._add_window_choices = available_windows
+        cached = self._add_window_dialog
+        if cached is not None and cached[0].winfo_exists():
+            dialog, filter_entry, refilter, theme_key = cached
+            if theme_key == (self.current_theme, self.accent_color):
+                filter_entry.delete(0, tk.END)
+                refilter()
+                dialog.deiconify()
+                dialog.lift()
+                dialog.grab_set()
+                return
+            dialog.destroy()
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("Add Window")
         dialog.geometry("500x400")
@@ -939,6 +1686,12 @@ class PiPBoard:
         dialog.transient(self.root)
         dialog.grab_set()
         
+        def hide():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", hide)
+        
         header = tk.Label(
             dialog,
             text="Select a window to monitor",
@@ -948,6 +1701,16 @@ class PiPBoard:
         )
         header.pack(pady=(20, 10), padx=20)
         
+        filter_entry = tk.Entry(
+            dialog,
+            bg=self.card_bg,
+            fg=self.text_color,
+            insertbackground=self.text_color,
+            font=("Segoe UI", 10),
+            relief="flat"
+        )
+        filter_entry.pack(fill=tk.X, padx=20)
+        
         list_container = tk.Frame(dialog, bg=self.card_bg)
         list_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
@@ -968,8 +1731,19 @@ class PiPBoard:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        for hwnd, title in available_windows:
-            listbox.insert(tk.END, title)
+        # Windows currently shown in the listbox, in listbox order
+        visible = []
+        
+        def refilter(event=None):
+            needle = filter_entry.get().strip().lower()
+            visible[:] = [(hwnd, title) for hwnd, title in self._add_window_choices
+                          if needle in title.lower()]
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, *(title for hwnd, title in visible))
+        
+        refilter()
+        filter_entry.bind('<KeyRelease>', refilter)
+        filter_entry.focus_set()
         
         button_frame = tk.Frame(dialog, bg=self.bg_color)
         button_frame.pack(pady=20)
@@ -977,14 +1751,16 @@ class PiPBoard:
         def on_select():
             selection = listbox.curselection()
             if selection:
-                hwnd, title = available_windows[selection[0]]
+                hwnd, title = visible[selection[0]]
+                hide()
                 self.add_client(hwnd, title)
-                dialog.destroy()
         
         ModernButton(button_frame, "Add", on_select, width=120).pack(side=tk.LEFT, padx=5)
-        ModernButton(button_frame, "Cancel", dialog.destroy, bg=self.button_bg, hover_bg=self.button_hover, width=120).pack(side=tk.LEFT, padx=5)
+        ModernButton(button_frame, "Cancel", hide, bg=self.button_bg, hover_bg=self.button_hover, width=120).pack(side=tk.LEFT, padx=5)
         
         listbox.bind('<Double-Button-1>', lambda e: on_select())
+        filter_entry.bind('<Return>', lambda e: on_select())
+        self._add_window_dialog = (dialog, filter_entry, refilter, (self.current_theme, self.accent_color))
     
     def add_client(self, hwnd, title):
         with self.client_lock:
@@ -996,11 +1772,16 @@ class PiPBoard:
         row = client_count // self.grid_columns
         col = client_count % self.grid_columns
         
-        card, img_label, controls, title_label, status_indicator, cpu_label = self.create_modern_card(
-            self.scrollable_frame,
-            title,
-            client_count + 1
-        )
+        if self._card_pool:
+            # Reuse a removed client's widgets; theming kept them current while hidden
+            card, img_label, title_label, status_indicator, status_oval_id, cpu_label = self._card_pool.pop()
+            title_label.configure(text=f"#{client_count + 1} {title}")
+            cpu_label.configure(text="0%")
+            thumb_width, thumb_height = self.current_thumbnail_size
+            img_label.master.configure(width=thumb_width, height=thumb_height)
+        else:
+            card, img_label, title_label, status_indicator, status_oval_id, cpu_label = self.build_client_card(title, client_count + 1)
+        card.client_hwnd = hwnd
         
         card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
         
@@ -1008,144 +1789,208 @@ class PiPBoard:
         self.scrollable_frame.grid_columnconfigure(col, weight=1, minsize=thumb_width + 30)
         self.scrollable_frame.grid_rowconfigure(row, weight=1)
         
-        img_label.bind('<Button-1>', lambda e: self.expand_pip(hwnd))
+        photo = self.attach_thumbnail_photo(img_label)  # Fresh, so a reused card never shows the old frame
+        
+        # Later changes only arrive as minimize/restore events, so start from the real state
+        is_minimized = bool(win32gui.IsIconic(hwnd))
+        
+        pid = None
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            self._get_process(pid)
+        except Exception as e:
+            logging.debug(f"Could not open process for {hwnd}: {e}")
+        
+        with self.client_lock:
+            self.clients[hwnd] = ClientState(
+                title=title,
+                frame=card,
+                label=img_label,
+                title_label=title_label,
+                status_indicator=status_indicator,
+                status_oval_id=status_oval_id,
+                cpu_label=cpu_label,
+                photo=photo,
+                capture=WindowCapture(hwnd),
+                pid=pid,
+                row=row,
+                col=col,
+                is_minimized=is_minimized
+            )
+            self.client_order.append(hwnd)
+            self._publish_clients()
+        
+        self.update_client_status(hwnd, is_minimized)
+        self.capture_sleeper.mark_active()
+        logging.info(f"Added client: {title} (hwnd: {hwnd})")
+
+        # Scroll to top when adding new window
+        self.canvas.yview_moveto(0)
+    
+    def build_client_card(self, title, position):
+        """Create the widgets for one client card.
+        
+        The click handlers act on card.client_hwnd rather than a fixed hwnd, so
+        the card can be handed to another client after its own is removed.
+        """
+        card, img_label, controls, title_label, status_indicator, status_oval_id, cpu_label = self.create_modern_card(
+            self.scrollable_frame,
+            title,
+            position
+        )
+        
+        img_label.bind('<Button-1>', lambda e: self.expand_pip(card.client_hwnd))
         
-        btn_frame = tk.Frame(controls, bg=self.card_bg)
+        btn_frame = ttk.Frame(controls, style="Card.TFrame")
         btn_frame.pack(side=tk.LEFT)
         
         up_btn = tk.Label(btn_frame, text="↑", fg=self.text_color, bg=self.card_bg, cursor="hand2", font=("Segoe UI", 12), padx=10)
         up_btn.pack(side=tk.LEFT, padx=2)
-        up_btn.bind("<Button-1>", lambda e: self.move_client(hwnd, -1))
+        up_btn.bind("<Button-1>", lambda e: self.move_client(card.client_hwnd, -1))
+        self.themed(up_btn, fg="text_color", bg="card_bg")
         
         down_btn = tk.Label(btn_frame, text="↓", fg=self.text_color, bg=self.card_bg, cursor="hand2", font=("Segoe UI", 12), padx=10)
         down_btn.pack(side=tk.LEFT, padx=2)
-        down_btn.bind("<Button-1>", lambda e: self.move_client(hwnd, 1))
+        down_btn.bind("<Button-1>", lambda e: self.move_client(card.client_hwnd, 1))
+        self.themed(down_btn, fg="text_color", bg="card_bg")
         
         remove_btn = tk.Label(controls, text="✕ Remove", fg="#ff4444", bg=self.card_bg, cursor="hand2", font=("Segoe UI", 9))
         remove_btn.pack(side=tk.RIGHT)
-        remove_btn.bind("<Button-1>", lambda e: self.remove_client(hwnd))
-        
-        with self.client_lock:
-            self.clients[hwnd] = {
-                "title": title,
-                "frame": card,
-                "label": img_label,
-                "title_label": title_label,
-                "status_indicator": status_indicator,
-                "cpu_label": cpu_label,
-                "photo": None,
-                "row": row,
-                "col": col,
-                "last_update": 0,
-                "position": client_count,
-                "is_minimized": False,
-                "cpu_usage": 0.0
-            }
+        remove_btn.bind("<Button-1>", lambda e: self.remove_client(card.client_hwnd))
+        self.themed(remove_btn, bg="card_bg")
         
-        logging.info(f"Added client: {title} (hwnd: {hwnd})")
-
-        # Scroll to top when adding new window
-        self.canvas.yview_moveto(0)
+        return card, img_label, title_label, status_indicator, status_oval_id, cpu_label
+    
+    def _publish_clients(self):
+        """Rebuild the lock-free clients snapshot; call with client_lock held"""
+        self._clients_snapshot = MappingProxyType(dict(self.clients))
+    
+    def _get_process(self, pid):
+        """Return the cached psutil.Process for a pid, creating and priming it if needed"""
+        import psutil
+        
+        proc = self._proc_cache.get(pid)
+        if proc is None:
+            proc = psutil.Process(pid)
+            proc.cpu_percent(interval=None)  # First sample only primes the counter
+            self._proc_cache[pid] = proc
+        return proc
     
     def monitor_cpu_usage(self):
         """Monitor CPU usage for each window"""
-        process_cache = {}
+        import psutil  # Deferred so the import runs on this thread, not during startup
         
-        while self.running:
+        while not self._stop.is_set():
             try:
-                with self.client_lock:
-                    clients_copy = list(self.clients.keys())
+                clients_copy = [(hwnd, data.pid) for hwnd, data in self._clients_snapshot.items()]
                 
-                for hwnd in list(process_cache.keys()):
-                    if hwnd not in clients_copy:
-                        del process_cache[hwnd]
+                # One sample per process per sweep: a second cpu_percent() call on
+                # the same Process right after the first would measure a ~0s window
+                samples = {}
+                updates = {}
                 
-                for hwnd in clients_copy:
-                    if not win32gui.IsWindow(hwnd):
-                        if hwnd in process_cache:
-                            del process_cache[hwnd]
+                for hwnd, pid in clients_copy:
+                    if pid is None or not win32gui.IsWindow(hwnd):
                         continue
                     
                     try:
-                        if hwnd not in process_cache:
-                            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                            proc = psutil.Process(pid)
-                            proc.cpu_percent(interval=None)
-                            process_cache[hwnd] = proc
-                        
-                        cpu_usage = process_cache[hwnd].cpu_percent(interval=None)
+                        cpu_usage = samples.get(pid)
+                        if cpu_usage is None:
+                            cpu_usage = samples[pid] = get_process_cpu_usage(self._get_process(pid))
                         
-                        with self.client_lock:
-                            if hwnd in self.clients:
-                                self.clients[hwnd]["cpu_usage"] = cpu_usage
-                                self.queue_ui_update(self.update_cpu_display, hwnd, cpu_usage)
+                        # This thread is the only writer of the CPU fields
+                        client = self._clients_snapshot.get(hwnd)
+                        if client is not None:
+                            client.cpu_usage = cpu_usage
+                            
+                            # Only repaint the label when the reading moved by a point or more
+                            shown = client.shown_cpu
+                            if shown is None or abs(cpu_usage - shown) >= 1.0:
+                                client.shown_cpu = cpu_usage
+                                updates[hwnd] = cpu_usage
                                 
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        if hwnd in process_cache:
-                            del process_cache[hwnd]
+                        self._proc_cache.pop(pid, None)
                     except Exception as e:
                         logging.error(f"Error getting CPU usage for {hwnd}: {e}")
-                        if hwnd in process_cache:
-                            del process_cache[hwnd]
+                        self._proc_cache.pop(pid, None)
                 
-                time.sleep(1)
+                # All labels that changed this sweep are repainted by one UI callback
+                if updates:
+                    self.queue_ui_update(self.flush_cpu, updates)
+                
+                if self._stop.wait(1):
+                    return
                 
             except Exception as e:
                 logging.error(f"Error in CPU monitor thread: {e}")
-                time.sleep(2)
+                if self._stop.wait(2):
+                    return
+    
+    def flush_cpu(self, updates):
+        """Show a sweep's worth of CPU readings (hwnd -> percent)"""
+        for hwnd, cpu_usage in updates.items():
+            self.update_cpu_display(hwnd, cpu_usage)
     
     def update_cpu_display(self, hwnd, cpu_usage):
         """Update CPU usage display"""
         try:
-            with self.client_lock:
-                if hwnd not in self.clients:
-                    return
-                cpu_label = self.clients[hwnd]["cpu_label"]
+            client = self._clients_snapshot.get(hwnd)
+            if client is None:
+                return
             
-            cpu_label.configure(text=f"{cpu_usage:.1f}%")
+            client.cpu_label.configure(text=f"{cpu_usage:.1f}%")
         except Exception as e:
             logging.error(f"Error updating CPU display for {hwnd}: {e}")
     
     def monitor_window_states(self):
         """Monitor window states to update status indicators"""
-        while self.running:
+        while not self._stop.is_set():
             try:
-                with self.client_lock:
-                    clients_copy = list(self.clients.keys())
-                
-                for hwnd in clients_copy:
+                for hwnd, client in self._clients_snapshot.items():
                     if not win32gui.IsWindow(hwnd):
                         continue
                     
                     try:
-                        is_minimized = win32gui.IsIconic(hwnd)
-                        
-                        with self.client_lock:
-                            if hwnd in self.clients:
-                                old_state = self.clients[hwnd].get("is_minimized", False)
-                                if old_state != is_minimized:
-                                    self.clients[hwnd]["is_minimized"] = is_minimized
-                                    self.queue_ui_update(self.update_client_status, hwnd, is_minimized)
+                        # Compare against the snapshot first; the lock is only
+                        # taken for the rare poll that sees a state change
+                        is_minimized = bool(win32gui.IsIconic(hwnd))
+                        if is_minimized != client.is_minimized:
+                            self.set_client_minimized(hwnd, is_minimized)
                     except Exception as e:
                         logging.error(f"Error checking window state for {hwnd}: {e}")
                 
-                time.sleep(0.5)
+                if self._stop.wait(0.5):
+                    return
                 
             except Exception as e:
                 logging.error(f"Error in status monitor thread: {e}")
-                time.sleep(1)
+                if self._stop.wait(1):
+                    return
+    
+    def set_client_minimized(self, hwnd, is_minimized):
+        """Record a client's minimized state and refresh its indicator if it changed"""
+        with self.client_lock:
+            if hwnd not in self.clients or self.clients[hwnd].is_minimized == is_minimized:
+                return
+            self.clients[hwnd].is_minimized = is_minimized
+            self.queue_client_update(hwnd, self.update_client_status, is_minimized)
+        
+        if not is_minimized:
+            client = self._clients_snapshot.get(hwnd)
+            if client is not None:
+                client.next_capture_ts = 0.0  # Capture now, not when the hidden re-check is due
+            self.capture_sleeper.mark_active()  # A restored window needs capturing again
     
     def update_client_status(self, hwnd, is_minimized):
         """Update client status indicator"""
         try:
-            with self.client_lock:
-                if hwnd not in self.clients:
-                    return
-                status_ind = self.clients[hwnd]["status_indicator"]
+            client = self._clients_snapshot.get(hwnd)
+            if client is None:
+                return
             
             color = "#00ff00" if is_minimized else "#ff4444"
-            status_ind.delete("all")
-            status_ind.create_oval(2, 2, 8, 8, fill=color, outline="")
+            client.status_indicator.itemconfig(client.status_oval_id, fill=color)
         except Exception as e:
             logging.error(f"Error updating status for {hwnd}: {e}")
     
@@ -1154,36 +1999,40 @@ class PiPBoard:
             if hwnd not in self.clients:
                 return
             
-            current_pos = self.clients[hwnd]["position"]
+            order = self.client_order
+            current_pos = order.index(hwnd)
             new_pos = current_pos + direction
             
-            if new_pos < 0 or new_pos >= len(self.clients):
+            if new_pos < 0 or new_pos >= len(order):
                 return
             
-            target_hwnd = None
-            for check_hwnd, client_data in self.clients.items():
-                if client_data["position"] == new_pos:
-                    target_hwnd = check_hwnd
-                    break
-            
-            if target_hwnd:
-                self.clients[hwnd]["position"] = new_pos
-                self.clients[target_hwnd]["position"] = current_pos
+            order[current_pos], order[new_pos] = order[new_pos], order[current_pos]
         
         self.reorganize_grid()
     
     def remove_client(self, hwnd):
         with self.client_lock:
             if hwnd in self.clients:
-                self.clients[hwnd]["frame"].destroy()
+                client = self.clients[hwnd]
+                if len(self._card_pool) < CARD_POOL_MAX:
+                    client.frame.grid_forget()
+                    client.frame.client_hwnd = None
+                    client.label.configure(image="")
+                    self._card_pool.append((client.frame, client.label, client.title_label,
+                                            client.status_indicator, client.status_oval_id, client.cpu_label))
+                else:
+                    client.frame.destroy()
+                client.capture.close()
+                pid = self.clients[hwnd].pid
                 del self.clients[hwnd]
+                self.client_order.remove(hwnd)
+                self._pending_frames.pop(hwnd, None)
+                self._publish_clients()
                 
-                for idx, (client_hwnd, client_data) in enumerate(sorted(self.clients.items(), key=lambda x: x[1]["position"])):
-                    client_data["position"] = idx
+                if all(data.pid != pid for data in self.clients.values()):
+                    self._proc_cache.pop(pid, None)
         
-        with self.expanded_lock:
-            self.expanded_windows.discard(hwnd)
-            self.paused_clients.discard(hwnd)
+        self._forget_expanded(hwnd)
         
         self.reorganize_grid()
         logging.info(f"Removed client hwnd: {hwnd}")
@@ -1195,17 +2044,17 @@ class PiPBoard:
                 return
             
             try:
-                with self.client_lock:
-                    if hwnd not in self.clients:
-                        return
-                    window_title = self.clients[hwnd]["title"]
+                client = self._clients_snapshot.get(hwnd)
+                if client is None:
+                    return
+                window_title = client.title
                 
                 is_dreambot = "DreamBot" in window_title
                 
                 with self.expanded_lock:
-                    self.expanded_windows.add(hwnd)
+                    self.expanded_windows |= {hwnd}
                     if is_dreambot:
-                        self.paused_clients.add(hwnd)
+                        self.paused_clients |= {hwnd}
                 
                 if win32gui.IsIconic(hwnd):
                     win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
@@ -1227,231 +2076,265 @@ class PiPBoard:
                 
             except Exception as e:
                 logging.error(f"Error bringing window to front: {e}")
-                with self.expanded_lock:
-                    self.paused_clients.discard(hwnd)
-                    self.expanded_windows.discard(hwnd)
+                self._forget_expanded(hwnd)
         
         thread = threading.Thread(target=expand_async, daemon=True)
         thread.start()
     
+    def _forget_expanded(self, hwnd):
+        """Drop hwnd from the expanded and paused sets"""
+        with self.expanded_lock:
+            self.expanded_windows -= {hwnd}
+            self.paused_clients -= {hwnd}
+    
     def monitor_expanded_windows(self):
         last_foreground = None
         
-        while self.running:
+        while not self._stop.is_set():
             try:
                 if not self.auto_minimize_var.get():
-                    time.sleep(0.5)
+                    if self._stop.wait(0.5):
+                        return
                     continue
                 
-                with self.expanded_lock:
-                    expanded_copy = self.expanded_windows.copy()
-                
-                if expanded_copy:
+                if self.expanded_windows:
                     try:
                         current_foreground = win32gui.GetForegroundWindow()
                     except:
                         current_foreground = None
                     
                     if current_foreground != last_foreground:
-                        for hwnd in expanded_copy:
-                            if hwnd == current_foreground:
-                                continue
-                            
-                            if not win32gui.IsWindow(hwnd):
-                                with self.expanded_lock:
-                                    self.expanded_windows.discard(hwnd)
-                                    self.paused_clients.discard(hwnd)
-                                continue
-                            
-                            try:
-                                if not win32gui.IsIconic(hwnd):
-                                    win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-                                
-                                with self.expanded_lock:
-                                    self.expanded_windows.discard(hwnd)
-                                    self.paused_clients.discard(hwnd)
-                                    
-                            except Exception as e:
-                                with self.expanded_lock:
-                                    self.expanded_windows.discard(hwnd)
-                                    self.paused_clients.discard(hwnd)
-                        
+                        self.minimize_expanded_except(current_foreground)
                         last_foreground = current_foreground
                 
-                time.sleep(0.3)
+                if self._stop.wait(0.3):
+                    return
                 
             except Exception as e:
                 logging.error(f"Error in monitor thread: {e}")
-                time.sleep(0.5)
+                if self._stop.wait(0.5):
+                    return
+    
+    def minimize_expanded_except(self, current_foreground):
+        """Re-minimize every expanded window that just lost the foreground"""
+        for hwnd in self.expanded_windows:
+            if hwnd == current_foreground:
+                continue
+            
+            try:
+                if win32gui.IsWindow(hwnd) and not win32gui.IsIconic(hwnd):
+                    win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
+            except Exception as e:
+                logging.debug(f"Could not minimize {hwnd}: {e}")
+            
+            self._forget_expanded(hwnd)
     
     def reorganize_grid(self):
+        """Schedule a regrid; any number of calls before the next idle run it once"""
+        if self._regrid_pending:
+            return
+        self._regrid_pending = True
+        self.root.after_idle(self._run_regrid)
+    
+    def _run_regrid(self):
+        self._regrid_pending = False
+        # Hold geometry propagation so the frame is only re-measured once at the end
+        self.scrollable_frame.grid_propagate(False)
+        try:
+            self._do_reorganize_grid()
+        finally:
+            self.scrollable_frame.grid_propagate(True)
+    
+    def _do_reorganize_grid(self):
         with self.client_lock:
-            sorted_clients = sorted(self.clients.items(), key=lambda x: x[1]["position"])
-            
-            for index, (hwnd, client_data) in enumerate(sorted_clients):
+            for index, hwnd in enumerate(self.client_order):
+                client_data = self.clients[hwnd]
                 row = index // self.grid_columns
                 col = index % self.grid_columns
                 
-                client_data["frame"].grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
-                client_data["title_label"].configure(text=f"#{index + 1} {client_data['title']}")
-                client_data["row"] = row
-                client_data["col"] = col
-                client_data["position"] = index
-                
-                # Update column configuration
-                self.scrollable_frame.grid_columnconfigure(col, weight=1, minsize=self.current_thumbnail_size[0] + 30)
-    
-    def capture_window(self, hwnd):
+                client_data.frame.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
+                client_data.title_label.configure(text=f"#{index + 1} {client_data.title}")
+                client_data.row = row
+                client_data.col = col
+
+            # Configure each occupied column once, then drop the configuration
+            # of columns/rows left over from a larger grid
+            count = len(self.client_order)
+            used_cols = min(count, self.grid_columns)
+            used_rows = -(-count // self.grid_columns)
+            col_minsize = self.current_thumbnail_size[0] + 30
+            for col in range(used_cols):
+                self.scrollable_frame.grid_columnconfigure(col, weight=1, minsize=col_minsize)
+            grid_cols, grid_rows = self.scrollable_frame.grid_size()
+            for col in range(used_cols, grid_cols):
+                self.scrollable_frame.grid_columnconfigure(col, weight=0, minsize=0)
+            for row in range(used_rows, grid_rows):
+                self.scrollable_frame.grid_rowconfigure(row, weight=0)
+
+    def capture_window(self, hwnd, capture):
         try:
-            window_rect = win32gui.GetWindowRect(hwnd)
-            left, top, right, bottom = window_rect
-            window_width = right - left
-            window_height = bottom - top
-            
-            if window_width <= 0 or window_height <= 0:
-                return None
-            
+            # PrintWindow with PW_CLIENTONLY renders just the client area at the
+            # bitmap origin, so size the capture to the client rect
             try:
-                client_rect = win32gui.GetClientRect(hwnd)
-                client_width = client_rect[2]
-                client_height = client_rect[3]
-                
-                client_to_screen = win32gui.ClientToScreen(hwnd, (0, 0))
-                offset_x = client_to_screen[0] - left
-                offset_y = client_to_screen[1] - top
-                
-                if client_width < window_width - 10 or client_height < window_height - 10:
-                    capture_width = client_width
-                    capture_height = client_height
-                    use_offset = True
-                else:
-                    capture_width = window_width
-                    capture_height = window_height
-                    use_offset = False
-                    offset_x = 0
-                    offset_y = 0
+                _, _, capture_width, capture_height = win32gui.GetClientRect(hwnd)
             except:
-                capture_width = window_width
-                capture_height = window_height
-                use_offset = False
-                offset_x = 0
-                offset_y = 0
-            
-            hwndDC = win32gui.GetWindowDC(hwnd)
-            mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-            saveDC = mfcDC.CreateCompatibleDC()
-            
-            saveBitMap = win32ui.CreateBitmap()
-            saveBitMap.CreateCompatibleBitmap(mfcDC, window_width, window_height)
-            saveDC.SelectObject(saveBitMap)
+                capture_width = capture_height = 0
             
-            result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), 3)
+            if capture_width <= 0 or capture_height <= 0:
+                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+                capture_width = right - left
+                capture_height = bottom - top
             
-            img = None
-            
-            if result == 1:
-                bmpinfo = saveBitMap.GetInfo()
-                bmpstr = saveBitMap.GetBitmapBits(True)
-                img = Image.frombuffer(
-                    'RGB',
-                    (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                    bmpstr, 'raw', 'BGRX', 0, 1
-                )
-                
-                if use_offset and offset_x > 0 and offset_y > 0:
-                    try:
-                        img = img.crop((offset_x, offset_y, offset_x + capture_width, offset_y + capture_height))
-                    except:
-                        pass
-                
-                thumb_size = self.current_thumbnail_size
-                img = img.resize(thumb_size, Image.LANCZOS)
-            
-            win32gui.DeleteObject(saveBitMap.GetHandle())
-            saveDC.DeleteDC()
-            mfcDC.DeleteDC()
-            win32gui.ReleaseDC(hwnd, hwndDC)
+            if capture_width <= 0 or capture_height <= 0:
+                return None
             
-            return img
+            return capture.grab(capture_width, capture_height, self.current_thumbnail_size, self.thumb_resample)
             
         except Exception as e:
             logging.error(f"Error capturing window {hwnd}: {e}")
             return None
     
     def capture_loop(self):
-        while self.running:
-            if not self.paused:
-                with self.client_lock:
-                    has_clients = len(self.clients) > 0
+        # Bound once; these run for every client on every wake
+        now = time.time
+        is_window = win32gui.IsWindow
+        is_iconic = win32gui.IsIconic
+        is_visible = win32gui.IsWindowVisible
+        is_cloaked = is_window_cloaked
+        
+        while not self._stop.is_set():
+            if not self.paused and not self.viewer_hidden:
+                clients = self._clients_snapshot
                 
-                if has_clients:
-                    start_time = time.time()
+                if clients:
+                    start_time = now()
                     
+                    foreground_hwnd = None
                     try:
                         foreground_hwnd = win32gui.GetForegroundWindow()
-                        with self.expanded_lock:
-                            paused_copy = self.paused_clients.copy()
-                        
-                        for hwnd in paused_copy:
-                            if hwnd != foreground_hwnd:
-                                with self.expanded_lock:
-                                    self.paused_clients.discard(hwnd)
+                        # A client stays paused only while it is the foreground window;
+                        # the lock is only needed on the rare tick that prunes the set
+                        if self.paused_clients - {foreground_hwnd}:
+                            with self.expanded_lock:
+                                self.paused_clients &= {foreground_hwnd}
                     except Exception as e:
                         logging.error(f"Error checking foreground: {e}")
                     
-                    with self.client_lock:
-                        clients_copy = list(self.clients.keys())
-                    
-                    for hwnd in clients_copy:
-                        with self.expanded_lock:
-                            if hwnd in self.paused_clients:
-                                continue
+                    paused = self.paused_clients
+                    jobs = []
+                    next_due = start_time + CAPTURE_MAX_SLEEP
+                    for hwnd, client in clients.items():
+                        if hwnd in paused:
+                            continue
                         
-                        if not win32gui.IsWindow(hwnd):
-                            self.queue_ui_update(self.remove_client, hwnd)
+                        current_time = now()
+                        # A recent successful capture already proves the window exists;
+                        # once a dead window's captures start failing this catches it
+                        if (current_time - client.last_capture_ok > CAPTURE_ALIVE_WINDOW
+                                and not is_window(hwnd)):
+                            self.queue_client_update(hwnd, self.remove_client)
                             continue
                         
-                        with self.client_lock:
-                            if hwnd not in self.clients:
-                                continue
-                            current_time = time.time()
-                            last_update = self.clients[hwnd].get("last_update", 0)
+                        next_capture = client.next_capture_ts
+                        cpu_usage = client.cpu_usage
+                        capture = client.capture
+                        is_minimized = client.is_minimized
+                        if not is_minimized:
+                            self.capture_sleeper.record_work()
                         
-                        time_since_update = current_time - last_update
-                        should_capture = time_since_update > 0.5
+                        # Not due yet: skip before paying for any Win32/DWM state queries
+                        if current_time < next_capture:
+                            next_due = min(next_due, next_capture)
+                            continue
                         
-                        if should_capture:
-                            img = self.capture_window(hwnd)
-                            
-                            if img:
-                                try:
-                                    photo = ImageTk.PhotoImage(img)
-                                    with self.client_lock:
-                                        if hwnd in self.clients:
-                                            self.clients[hwnd]["photo"] = photo
-                                            self.clients[hwnd]["last_update"] = current_time
-                                    self.queue_ui_update(self.update_client_image, hwnd, photo)
-                                except Exception as e:
-                                    logging.error(f"Error creating PhotoImage: {e}")
+                        # PrintWindow on an iconic, hidden or cloaked window does the full
+                        # GDI work and returns a blank frame that would overwrite the snapshot.
+                        # Cheapest first: cached flag, IsIconic, IsWindowVisible, then DWM
+                        if not self.capture_when_minimized and (
+                                is_minimized or is_iconic(hwnd)
+                                or not is_visible(hwnd) or is_cloaked(hwnd)):
+                            # Re-check later rather than on every wake; a restore resets this
+                            client.next_capture_ts = current_time + CAPTURE_MIN_INTERVAL
+                            next_due = min(next_due, client.next_capture_ts)
+                            continue
+                        
+                        if hwnd == foreground_hwnd:
+                            backoff = 2 ** min(client.static_frames, 8)
+                            interval = min(CAPTURE_STATIC_MAX_INTERVAL, backoff / self.fps)
+                        else:
+                            idle = max(0.0, 1.0 - cpu_usage / CAPTURE_BUSY_CPU)
+                            interval = CAPTURE_MIN_INTERVAL + CAPTURE_IDLE_BACKOFF * idle
+                        jobs.append((hwnd, capture, current_time + interval))
+                        next_due = min(next_due, current_time + interval)
+                    
+                    try:
+                        futures = {
+                            self._cap_pool.submit(self.capture_window, hwnd, capture): (hwnd, next_capture)
+                            for hwnd, capture, next_capture in jobs
+                        }
+                    except RuntimeError:
+                        return  # Pool was shut down by on_closing
                     
-                    elapsed = time.time() - start_time
-                    target_delay = 1.0 / self.fps
-                    sleep_time = max(0, target_delay - elapsed)
-                    time.sleep(sleep_time)
+                    captured = False
+                    for future in as_completed(futures):
+                        # on_closing cancels jobs that have not started; result() would
+                        # raise CancelledError for those
+                        if future.cancelled() or self._stop.is_set():
+                            return
+                        img = future.result()  # capture_window logs and returns None on errors
+                        if img:
+                            hwnd, next_capture = futures[future]
+                            client = clients[hwnd]
+                            changed = img is not WindowCapture.UNCHANGED
+                            # Owned by this thread; foreground and restore handlers only ever reset it to 0
+                            client.next_capture_ts = next_capture
+                            client.last_capture_ok = now()
+                            client.static_frames = 0 if changed else client.static_frames + 1
+                            if changed:
+                                with self.client_lock:
+                                    if hwnd in self.clients:
+                                        self._pending_frames[hwnd] = img
+                            captured = captured or changed
+                    
+                    # One UI callback shows every frame captured this tick
+                    if captured:
+                        self.queue_ui_update(self.flush_frames)
+                    
+                    # Sleep until the earliest client is due rather than a fixed frame time
+                    sleep_time = max(0, next_due - now())
+                    if self.capture_sleeper.wait(sleep_time):
+                        return
                 else:
-                    time.sleep(0.1)
+                    if self.capture_sleeper.wait(0.1):
+                        return
             else:
-                time.sleep(0.1)
+                if self.capture_sleeper.wait(0.1):
+                    return
+    
+    def flush_frames(self):
+        """Show all thumbnails captured since the last flush"""
+        with self.client_lock:
+            frames, self._pending_frames = self._pending_frames, {}
+        
+        for hwnd, img in frames.items():
+            self.update_client_image(hwnd, img)
     
-    def update_client_image(self, hwnd, photo):
+    def update_client_image(self, hwnd, img):
         try:
-            with self.client_lock:
-                if hwnd not in self.clients:
-                    return
-                label = self.clients[hwnd]["label"]
+            client = self._clients_snapshot.get(hwnd)
+            if client is None:
+                return
+            label = client.label
+            photo = client.photo
             
-            label.configure(image=photo)
-            label.image = photo
+            if photo is not None and (photo.width(), photo.height()) == img.size:
+                # Reuse the label's existing Tk image
+                photo.paste(img)
+            else:
+                photo = ImageTk.PhotoImage(img)
+                label.configure(image=photo)
+                label.image = photo
+                client.photo = photo
         except Exception as e:
             logging.error(f"Error updating image for {hwnd}: {e}")
     
@@ -1459,22 +2342,41 @@ class PiPBoard:
         self.movie_mode = self.movie_mode_var.get()
         if self.movie_mode:
             self.fps = 5
+            self.thumb_resample = Image.LANCZOS  # Few enough frames to afford the sharper filter
             self.status_label.configure(text="Movie Mode", fg="#FFA500")
-            self.status_dot.delete("all")
-            self.status_dot.create_oval(2, 2, 10, 10, fill="#FFA500", outline="")
+            self.status_dot.itemconfig(self.status_dot_oval, fill="#FFA500")
         else:
             self.fps = 20
+            self.thumb_resample = None
             self.status_label.configure(text="Active", fg="#00ff00")
-            self.status_dot.delete("all")
-            self.status_dot.create_oval(2, 2, 10, 10, fill="#00ff00", outline="")
+            self.status_dot.itemconfig(self.status_dot_oval, fill="#00ff00")
+        
+        # Re-evaluate pacing right away instead of finishing the current sleep
+        self.capture_sleeper.mark_active()
     
     def show_settings_dialog(self):
-        """Show settings dialog"""
+        """Show settings dialog.
+        
+        The dialog is built once and hidden on close; it is only rebuilt when
+        the theme or accent colour it was drawn with has changed.
+        """
+        theme_key = (self.current_theme, self.accent_color)
+        if self._settings_dialog is not None and self._settings_dialog.winfo_exists():
+            if self._settings_dialog_key == theme_key:
+                self._refresh_settings_dialog()
+                self._settings_dialog.deiconify()
+                self._settings_dialog.lift()
+                return
+            self._settings_dialog.destroy()
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("Settings")
         dialog.geometry("600x650")
         dialog.configure(bg=self.bg_color)
         dialog.transient(self.root)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._settings_dialog = dialog
+        self._settings_dialog_key = theme_key
         
         header = tk.Label(
             dialog,
@@ -1505,10 +2407,7 @@ class PiPBoard:
         
         selected_theme = {"current": self.current_theme}
         
-        def set_theme(theme):
-            selected_theme["current"] = theme
-            save_setting("theme", theme)
-            # Update button colors
+        def paint_theme_buttons(theme):
             if theme == "dark":
                 dark_btn.bg = self.accent_color
                 dark_btn.hover_bg = self.accent_color
@@ -1522,6 +2421,11 @@ class PiPBoard:
             dark_btn.draw()
             light_btn.draw()
         
+        def set_theme(theme):
+            selected_theme["current"] = theme
+            save_setting("theme", theme)
+            paint_theme_buttons(theme)
+        
         dark_btn_bg = self.accent_color if selected_theme["current"] == "dark" else self.button_bg
         light_btn_bg = self.accent_color if selected_theme["current"] == "light" else self.button_bg
         dark_btn_fg = "white"
@@ -1617,6 +2521,14 @@ class PiPBoard:
         grid_slider.set(self.grid_columns)
         grid_slider.pack(anchor="w")
         
+        def refresh():
+            """Show the live settings again when the hidden dialog is reopened"""
+            selected_theme["current"] = self.current_theme
+            paint_theme_buttons(self.current_theme)
+            grid_slider.set(self.grid_columns)
+        
+        self._refresh_settings_dialog = refresh
+        
         # Apply and Close buttons
         btn_frame = tk.Frame(dialog, bg=self.bg_color)
         btn_frame.pack(pady=20)
@@ -1626,16 +2538,20 @@ class PiPBoard:
             self.current_theme = selected_theme["current"]
             save_setting("theme", self.current_theme)
             
-            dialog.destroy()  # Close dialog first
-            self.calculate_thumbnail_size()
-            self.reorganize_grid()
-            self.apply_theme()  # Apply theme which recreates all cards
+            dialog.withdraw()  # Close dialog first
+            if (self.current_theme, self.accent_color) != self._applied_look:
+                self.apply_theme()  # Recolors the widgets, then resizes and regrids the cards
+            elif self.calculate_thumbnail_size():
+                self.resize_cards()
+            else:
+                self.reorganize_grid()  # Only the column count can have changed
         
         ModernButton(btn_frame, "Apply & Close", apply_and_close, bg=self.accent_color, width=150).pack(side=tk.LEFT, padx=5)
-        ModernButton(btn_frame, "Close", dialog.destroy, bg=self.button_bg, hover_bg=self.button_hover, fg=self.button_text, width=100).pack(side=tk.LEFT, padx=5)
+        ModernButton(btn_frame, "Close", dialog.withdraw, bg=self.button_bg, hover_bg=self.button_hover, fg=self.button_text, width=100).pack(side=tk.LEFT, padx=5)
     
     def open_chatgpt(self):
         """Open ChatGPT in the default web browser"""
+        import webbrowser
         webbrowser.open("https://chatgpt.com")
         
     def show_help_dialog(self):
@@ -1658,27 +2574,39 @@ class PiPBoard:
         help_frame = tk.Frame(dialog, bg=self.card_bg)
         help_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
-        help_canvas = tk.Canvas(help_frame, bg=self.card_bg, highlightthickness=0)
-        help_scrollbar = tk.Scrollbar(help_frame, orient="vertical", command=help_canvas.yview)
-        help_scrollable = tk.Frame(help_canvas, bg=self.card_bg)
-        
-        help_scrollable.bind(
-            "<Configure>",
-            lambda e: help_canvas.configure(scrollregion=help_canvas.bbox("all"))
+        # A single read-only Text widget only lays out the lines in view and
+        # scrolls natively, instead of a Frame+Labels per section inside a Canvas
+        help_text = tk.Text(
+            help_frame,
+            bg=self.card_bg,
+            relief="flat",
+            highlightthickness=0,
+            wrap=tk.WORD,
+            cursor="arrow",
+            padx=15
         )
+        help_scrollbar = tk.Scrollbar(help_frame, orient="vertical", command=help_text.yview)
+        help_text.configure(yscrollcommand=help_scrollbar.set)
         
-        help_canvas.create_window((0, 0), window=help_scrollable, anchor="nw")
-        help_canvas.configure(yscrollcommand=help_scrollbar.set)
-        
-        def _on_mousewheel(event):
-            help_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        help_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        dialog.bind("<Destroy>", lambda e: help_canvas.unbind_all("<MouseWheel>"))
-        
-        help_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
+        help_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=15)
         help_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=15, padx=(0, 15))
         
+        help_text.tag_configure(
+            "title",
+            font=("Segoe UI", 11, "bold"),
+            foreground=self.text_color,
+            spacing1=8,
+            spacing3=5
+        )
+        help_text.tag_configure(
+            "desc",
+            font=("Segoe UI", 10),
+            foreground=self.text_secondary,
+            lmargin1=15,
+            lmargin2=15,
+            spacing3=14
+        )
+        
         help_sections = [
             ("🪟 Adding Windows", 
              "Click '＋ Add Window' to select any open window to monitor. The window will appear as a live thumbnail that updates automatically."),
@@ -1698,37 +2626,10 @@ class PiPBoard:
              "Reduces the capture frame rate to 5 FPS (from 20 FPS) to save CPU resources."),
         ]
         
-        for i, (section_title, description) in enumerate(help_sections):
-            section_frame = tk.Frame(help_scrollable, bg=self.card_bg)
-            section_frame.pack(fill=tk.X, pady=8, padx=15)
-            
-            title_label = tk.Label(
-                section_frame,
-                text=section_title,
-                font=("Segoe UI", 11, "bold"),
-                fg=self.text_color,
-                bg=self.card_bg,
-                anchor="w",
-                justify=tk.LEFT
-            )
-            title_label.pack(fill=tk.X, pady=(0, 5))
-            
-            desc_label = tk.Label(
-                section_frame,
-                text=description,
-                font=("Segoe UI", 10),
-                fg=self.text_secondary,
-                bg=self.card_bg,
-                anchor="w",
-                justify=tk.LEFT,
-                wraplength=600
-            )
-            desc_label.pack(fill=tk.X, padx=(15, 0))
-            
-            if i < len(help_sections) - 1:
-                separator_color = "#444444" if self.current_theme == "dark" else "#dddddd"
-                separator = tk.Frame(help_scrollable, bg=separator_color, height=1)
-                separator.pack(fill=tk.X, pady=10, padx=15)
+        for section_title, description in help_sections:
+            help_text.insert(tk.END, section_title + "\n", "title")
+            help_text.insert(tk.END, description + "\n", "desc")
+        help_text.configure(state=tk.DISABLED)
         
         btn_frame = tk.Frame(dialog, bg=self.bg_color)
         btn_frame.pack(pady=(0, 20))
@@ -1737,14 +2638,21 @@ class PiPBoard:
     def toggle_debug_panel(self):
         """Toggle the debug panel visibility"""
         if self.debug_panel_visible:
-            if self.debug_panel:
-                self.debug_panel.destroy()
-                self.debug_panel = None
+            self.close_debug_panel()
             self.debug_panel_visible = False
         else:
             self.show_debug_panel()
             self.debug_panel_visible = True
     
+    def close_debug_panel(self):
+        """Destroy the debug panel and stop its log refresh"""
+        if self._refresh_logs_job is not None:
+            self.root.after_cancel(self._refresh_logs_job)
+            self._refresh_logs_job = None
+        if self.debug_panel:
+            self.debug_panel.destroy()
+            self.debug_panel = None
+    
     def show_debug_panel(self):
         """Show the debug panel overlay"""
         self.debug_panel = tk.Toplevel(self.root)
@@ -1763,8 +2671,7 @@ class PiPBoard:
         
         def on_close():
             self.debug_panel_visible = False
-            self.debug_panel.destroy()
-            self.debug_panel = None
+            self.close_debug_panel()
         
         self.debug_panel.protocol("WM_DELETE_WINDOW", on_close)
         
@@ -1812,6 +2719,8 @@ class PiPBoard:
                 logs_btn.configure(bg=self.accent_color)
                 version_btn.configure(bg=self.card_bg)
             else:
+                if not version_content.winfo_children():
+                    build_version_tab()
                 version_content.pack(fill=tk.BOTH, expand=True)
                 version_btn.configure(bg=self.accent_color)
                 logs_btn.configure(bg=self.card_bg)
@@ -1865,71 +2774,94 @@ class PiPBoard:
         logs_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         logs_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        global IN_MEMORY_LOGS
-        for log_entry in IN_MEMORY_LOGS:
-            logs_text.insert(tk.END, log_entry + "\n")
-        
-        logs_text.configure(state=tk.DISABLED)
-        logs_text.see(tk.END)
-        
-        version_info_frame = tk.Frame(version_content, bg=self.card_bg)
-        version_info_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        current_ver = get_current_version()
-        version_text = current_ver if current_ver else "Unknown"
-        
-        version_label = tk.Label(
-            version_info_frame,
-            text=f"Current Version: {version_text}",
-            font=("Segoe UI", 14, "bold"),
-            fg=self.text_color,
-            bg=self.card_bg
-        )
-        version_label.pack(pady=(20, 10))
-        
-        repo_label = tk.Label(
-            version_info_frame,
-            text=f"Repository: {GITHUB_REPO}",
-            font=("Segoe UI", 10),
-            fg=self.text_secondary,
-            bg=self.card_bg
-        )
-        repo_label.pack(pady=5)
-        
-        update_btn_frame = tk.Frame(version_info_frame, bg=self.card_bg)
-        update_btn_frame.pack(pady=20)
-        
-        ModernButton(
-            update_btn_frame,
-            "Check for Updates",
-            lambda: check_for_updates(show_no_update_message=True),
-            bg=self.accent_color,
-            width=200
-        ).pack()
+        logs_seen = {"count": 0}
         
+        def append_new_logs():
+            """Append only the entries logged since the last update"""
+            count, new_entries, full = MemoryLogHandler.entries_since(logs_seen["count"])
+            logs_seen["count"] = count
+            if not new_entries and not full:
+                return
+            logs_text.configure(state=tk.NORMAL)
+            if full:
+                logs_text.delete("1.0", tk.END)
+            if new_entries:
+                logs_text.insert(tk.END, "\n".join(new_entries) + "\n")
+            # Keep the widget as bounded as the log buffer itself
+            excess = int(logs_text.index("end-1c").split(".")[0]) - 1 - MAX_LOG_ENTRIES
+            if excess > 0:
+                logs_text.delete("1.0", f"{excess + 1}.0")
+            logs_text.configure(state=tk.DISABLED)
+            logs_text.see(tk.END)
+        
+        append_new_logs()
+        
+        def build_version_tab():
+            """Build the Version tab the first time it is shown"""
+            version_info_frame = tk.Frame(version_content, bg=self.card_bg)
+            version_info_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            
+            current_ver = get_current_version()
+            version_text = current_ver if current_ver else "Unknown"
+            
+            version_label = tk.Label(
+                version_info_frame,
+                text=f"Current Version: {version_text}",
+                font=("Segoe UI", 14, "bold"),
+                fg=self.text_color,
+                bg=self.card_bg
+            )
+            version_label.pack(pady=(20, 10))
+            
+            repo_label = tk.Label(
+                version_info_frame,
+                text=f"Repository: {GITHUB_REPO}",
+                font=("Segoe UI", 10),
+                fg=self.text_secondary,
+                bg=self.card_bg
+            )
+            repo_label.pack(pady=5)
+            
+            update_btn_frame = tk.Frame(version_info_frame, bg=self.card_bg)
+            update_btn_frame.pack(pady=20)
+            
+            ModernButton(
+                update_btn_frame,
+                "Check for Updates",
+                lambda: check_for_updates_in_background(self.queue_ui_update, show_no_update_message=True),
+                bg=self.accent_color,
+                width=200
+            ).pack()
+            
         show_tab("logs")
         
         def refresh_logs():
-            if self.debug_panel and self.debug_panel.winfo_exists() and current_tab["name"] == "logs":
-                try:
-                    logs_text.configure(state=tk.NORMAL)
-                    logs_text.delete("1.0", tk.END)
-                    for log_entry in IN_MEMORY_LOGS:
-                        logs_text.insert(tk.END, log_entry + "\n")
-                    logs_text.configure(state=tk.DISABLED)
-                    logs_text.see(tk.END)
-                    self.debug_panel.after(2000, refresh_logs)
-                except:
-                    pass
-        
-        self.debug_panel.after(2000, refresh_logs)
+            try:
+                # The log text is only touched while its tab is showing
+                if current_tab["name"] == "logs":
+                    append_new_logs()
+                    self._refresh_logs_job = self.debug_panel.after(1000, refresh_logs)
+                else:
+                    self._refresh_logs_job = self.debug_panel.after(2000, refresh_logs)
+            except tk.TclError:
+                return  # Panel destroyed under us
+        
+        self._refresh_logs_job = self.debug_panel.after(1000, refresh_logs)
     
     def on_closing(self):
         logging.info("Shutting down Multi-Client Viewer")
         # Save position one final time before closing
         self._save_window_position()
-        self.running = False
-        time.sleep(0.5)
+        self._stop.set()
+        self.capture_sleeper.mark_active()
+        self._cap_pool.shutdown(wait=False, cancel_futures=True)
+        self.window_events.stop()
+        self.window_event_queue.put(None)
+        # The loops wait on _stop, so they exit as soon as their current tick is
+        # done; give them at most 0.5s in total instead of always sleeping
+        deadline = time.monotonic() + 0.5
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
         self.root.quit()
         self.root.destroy()
     
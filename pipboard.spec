@@ -29,9 +29,7 @@ a = Analysis(
         # PIL/Pillow - expanded list
         'PIL',
         'PIL.Image',
-        'PIL.ImageGrab',
         'PIL.ImageTk',
-        'PIL.ImageDraw',
         'PIL._imaging',
         'PIL._tkinter_finder',
         